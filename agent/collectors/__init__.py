@@ -0,0 +1,6 @@
+"""
+Log collectors for Loglumen SIEM
+
+This package contains the per-platform collectors (linux, windows) and
+the shared event helpers in utils.
+"""
@@ -16,14 +16,36 @@ Author: Loglumen Team
 
 import os
 import re
+import glob
+import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from itertools import chain
+from sys import intern
+from typing import List, Dict, Any, Optional, Tuple
 
 # Import our helper utilities
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import create_event, get_hostname, get_local_ip, parse_syslog_timestamp
-
+try:
+    from ..utils import (
+        MONTHS, Event, get_hostname, get_local_ip, parse_syslog_timestamp, read_tail_lines
+    )
+except ImportError:
+    # Not imported as part of the collectors package (e.g. imported as
+    # linux.auth by main.py, or run directly as a script)
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from utils import (
+        MONTHS, Event, get_hostname, get_local_ip, parse_syslog_timestamp, read_tail_lines
+    )
+
+# Try to import Google's RE2 bindings (pip install google-re2)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 # Constants for log file locations
 AUTH_LOG_LOCATIONS = [
@@ -31,6 +53,78 @@ AUTH_LOG_LOCATIONS = [
     "/var/log/secure",         # RHEL/CentOS
 ]
 
+# Categorical values shared by every event. Interned so all events point
+# at the same string objects and compare by identity. Values extracted
+# from log lines that repeat a lot (usernames, IPs, auth methods) are
+# interned as they are parsed for the same reason.
+_CAT_AUTH = intern("authentication")
+_CAT_PRIV = intern("privilege_escalation")
+_CAT_REMOTE = intern("remote_access")
+_SEV_INFO = intern("info")
+_SEV_WARN = intern("warning")
+_PROTO_SSH = intern("ssh")
+_OS_LINUX = intern("linux")
+
+# Program tags we care about ("sshd[123]:", "sudo:", " su[456]:",
+# "login[789]:"). The name of the group that matched tells
+# _parse_log_line which parser to use.
+_DISPATCH_RE = re.compile(
+    r'(?P<sshd>sshd\[)|(?P<sudo>sudo[\[:])|(?P<su> su[\[:])|(?P<login>login[\[:])'
+)
+
+# Cheap literal prefilter run over the raw bytes read from the file.
+# Matches whole lines containing one of the program tags we parse. Most
+# of an auth log (cron, dbus, kernel, ...) is not interesting to us, so
+# lines that don't match never reach _parse_log_line and are never even
+# decoded. Uses RE2's non-backtracking matcher when it is installed.
+# The matched tag is captured so the line can be dispatched straight to
+# its parser without a second regex pass.
+_PREFILTER_RE = (re2 if RE2_AVAILABLE else re).compile(
+    rb'(?m)^.*?(sshd\[|sudo[\[:]| su[\[:]|login[\[:]).*$'
+)
+
+# Maps the tag captured by _PREFILTER_RE to the program it belongs to
+# (the same names as the groups in _DISPATCH_RE)
+_PROGRAM_TAGS = {
+    b'sshd[': 'sshd',
+    b'sudo[': 'sudo',
+    b'sudo:': 'sudo',
+    b' su[': 'su',
+    b' su:': 'su',
+    b'login[': 'login',
+    b'login:': 'login',
+}
+
+# Pre-compiled regex patterns used by the parsers below.
+# Compiling once at import time avoids re-parsing (and re-looking up)
+# the pattern strings for every single log line.
+
+# "Accepted <method> for <username> from <ip> port <port>"
+_SSH_ACCEPT_RE = re.compile(
+    r'Accepted (?P<method>\w+) for (?P<user>\S+) from '
+    r'(?:(?P<ip>[\d\.]+)(?= port))?.*?(?:port (?P<port>\d+)|$)'
+)
+
+# "Failed password for [invalid user ]<username> from <ip> port <port>"
+_SSH_FAIL_RE = re.compile(
+    r'for (?:invalid user )?(?P<user>\S+) from '
+    r'(?:(?P<ip>[\d\.]+)(?= port))?.*?(?:port (?P<port>\d+)|$)'
+)
+
+# "sudo: <username> : TTY=<tty> ; PWD=<pwd> ; USER=<target> ; COMMAND=<command>"
+_SUDO_RE = re.compile(
+    r'sudo:\s+(?P<user>\S+)\s+:(?:.*?TTY=(?P<tty>\S+))?(?:.*?PWD=(?P<pwd>\S+))?'
+    r'(?:.*?USER=(?P<target>\S+))?.*?COMMAND=(?P<cmd>.+)$'
+)
+
+# su: "(to <target>) <username> on <tty>"
+_SU_RE = re.compile(
+    r'\(to (?P<target>\S+)\)(?:\s+(?P<user>\S+)\s+on\s+(?P<tty>\S+))?'
+)
+
+# login: "session opened for user <username>" or "... user=<username>"
+_LOGIN_USER_RE = re.compile(r'(?:for user |user=)(?P<user>\S+)')
+
 
 class LinuxAuthCollector:
     """
@@ -56,8 +150,17 @@ class LinuxAuthCollector:
         else:
             self.log_file = self._find_auth_log()
 
-        # Track which lines we've already processed (for future use)
-        self.last_position = 0
+        # Event "source" field, computed once rather than for every event
+        self.log_source = os.path.basename(self.log_file) if self.log_file else ''
+
+        # Where the previous collection stopped reading (as returned by
+        # read_tail_lines()), so the next one only has to read lines
+        # appended since then
+        self.last_position: Optional[Tuple[int, int]] = None
+
+        # Syslog timestamps don't include the year; refreshed on every
+        # collect_events() call rather than looked up for every line
+        self.year = datetime.utcnow().year
 
     def _find_auth_log(self) -> Optional[str]:
         """
@@ -71,15 +174,20 @@ class LinuxAuthCollector:
                 return log_path
         return None
 
-    def collect_events(self, max_lines: int = 1000) -> List[Dict[str, Any]]:
+    def collect_events(self, max_lines: int = 1000) -> List[Event]:
         """
         Collect authentication events from the log file.
 
+        The first call reads the most recent lines of the log. Later calls
+        on the same collector only read lines appended since the previous
+        call (starting over if the log was rotated or truncated).
+
         Args:
             max_lines: Maximum number of log lines to read (most recent)
 
         Returns:
-            list: List of event dictionaries in Loglumen JSON format
+            list: List of Event objects (call to_dict() for the
+                Loglumen JSON format)
 
         Example:
             collector = LinuxAuthCollector()
@@ -87,43 +195,112 @@ class LinuxAuthCollector:
             print(f"Collected {len(events)} events")
         """
         events = []
+        self.year = datetime.utcnow().year
 
         # Check if log file exists
         if not self.log_file or not os.path.exists(self.log_file):
-            print(f"Warning: Auth log file not found. Tried: {AUTH_LOG_LOCATIONS}")
+            logger.warning("Auth log file not found. Tried: %s", AUTH_LOG_LOCATIONS)
             return events
 
         # Check if we have permission to read it
         if not os.access(self.log_file, os.R_OK):
-            print(f"Error: No permission to read {self.log_file}")
-            print("Tip: Try running with sudo")
+            logger.error("No permission to read %s (try running with sudo)", self.log_file)
             return events
 
         try:
-            # Read the log file
-            with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                # Read all lines (in production, you'd read only new lines)
-                lines = f.readlines()
-
-                # Process only the most recent lines
-                recent_lines = lines[-max_lines:] if len(lines) > max_lines else lines
+            # Read the most recent lines, or on later calls only the lines
+            # appended since the previous one. They stay raw bytes: lines
+            # are only decoded once they pass the prefilter, so the bulk of
+            # the file is never decoded at all. The regex engine then pulls
+            # the candidate lines out of the whole block in one scan
+            # instead of looping over every line in Python.
+            data, position = read_tail_lines(
+                self.log_file, max_lines, self.last_position
+            )
 
-                # Parse each line
-                for line in recent_lines:
-                    # Try to parse this line as an authentication event
-                    event = self._parse_log_line(line)
-                    if event:
-                        events.append(event)
+            # Hot loop: bind lookups to locals once
+            parse = self._parse_program_line
+            append = events.append
+            for match in _PREFILTER_RE.finditer(data):
+                # Try to parse this line as an authentication event
+                event = parse(
+                    _PROGRAM_TAGS[match.group(1)],
+                    match.group().decode('utf-8', 'ignore')
+                )
+                if event:
+                    append(event)
+
+            # Only move past these lines once they have all been parsed, so
+            # a failure part way through reads them again next time
+            self.last_position = position
 
         except PermissionError:
-            print(f"Error: Permission denied reading {self.log_file}")
-            print("Tip: Run with sudo to access system logs")
+            logger.error("Permission denied reading %s (run with sudo to access system logs)",
+                         self.log_file)
         except Exception as e:
-            print(f"Error reading log file: {e}")
+            logger.error("Error reading log file: %s", e)
 
         return events
 
-    def _parse_log_line(self, line: str) -> Optional[Dict[str, Any]]:
+    def _make_event(
+        self,
+        category: str,
+        event_type: str,
+        severity: str,
+        message: str,
+        timestamp: datetime,
+        data: Dict[str, Any]
+    ) -> Event:
+        """
+        Build an event for this collector.
+
+        The fields that never change for this collector (host, IP, source)
+        are filled in from values cached on the instance.
+
+        Returns:
+            Event: The event
+        """
+        return Event(
+            category,
+            event_type,
+            severity,
+            message,
+            self.log_source,
+            _OS_LINUX,
+            data,
+            self.hostname,
+            self.host_ip,
+            timestamp
+        )
+
+    def _parse_timestamp(self, line: str) -> datetime:
+        """
+        Parse the syslog timestamp at the start of a log line.
+
+        Syslog timestamps have a fixed layout ("Nov 16 14:30:25"), so the
+        fields are sliced out directly instead of going through strptime.
+        Anything that doesn't fit the layout falls back to
+        parse_syslog_timestamp().
+
+        Args:
+            line: Log line starting with a syslog timestamp
+
+        Returns:
+            datetime: Parsed timestamp
+        """
+        try:
+            return datetime(
+                self.year,
+                MONTHS[line[0:3]],
+                int(line[4:6]),
+                int(line[7:9]),
+                int(line[10:12]),
+                int(line[13:15])
+            )
+        except (KeyError, ValueError):
+            return parse_syslog_timestamp(line, self.year)
+
+    def _parse_log_line(self, line: str) -> Optional[Event]:
         """
         Parse a single log line and create an event if it's relevant.
 
@@ -131,41 +308,61 @@ class LinuxAuthCollector:
             line: A single line from the auth log
 
         Returns:
-            dict: Event dictionary, or None if line isn't relevant
+            Event: The event, or None if line isn't relevant
 
         This method checks for different types of authentication events
         and calls the appropriate parser method.
         """
-        # Skip empty lines
-        if not line.strip():
+        # Skip empty lines (just a newline, if anything). Whitespace-only
+        # lines fall through to the dispatcher, which won't match them.
+        if len(line) <= 1:
             return None
 
-        # Try to parse different event types
-        # Each parser returns an event dict or None
+        # Classify the line by its program tag in a single regex pass
+        # instead of a chain of substring scans. Each parser returns an
+        # event dict or None.
+        match = _DISPATCH_RE.search(line)
+
+        if match is None:
+            return None
+
+        return self._parse_program_line(match.lastgroup, line)
+
+    def _parse_program_line(self, program: str, line: str) -> Optional[Event]:
+        """
+        Parse a log line whose program tag has already been identified.
 
+        Args:
+            program: Program that wrote the line ("sshd", "sudo", "su" or "login")
+            line: A single line from the auth log
+
+        Returns:
+            Event: The event, or None if line isn't relevant
+        """
         # SSH events
-        if 'sshd' in line:
+        if program == 'sshd':
             if 'Accepted' in line:
                 return self._parse_ssh_success(line)
             elif 'Failed password' in line or 'authentication failure' in line:
                 return self._parse_ssh_failure(line)
 
         # Sudo events
-        elif 'sudo' in line and 'COMMAND=' in line:
-            return self._parse_sudo_command(line)
+        elif program == 'sudo':
+            if 'COMMAND=' in line:
+                return self._parse_sudo_command(line)
 
         # Su (switch user) events
-        elif ' su[' in line or ' su:' in line:
+        elif program == 'su':
             return self._parse_su_command(line)
 
         # Local login events
-        elif 'login' in line.lower():
+        elif program == 'login':
             return self._parse_local_login(line)
 
         # Not a relevant event
         return None
 
-    def _parse_ssh_success(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_ssh_success(self, line: str) -> Optional[Event]:
         """
         Parse a successful SSH login.
 
@@ -176,57 +373,39 @@ class LinuxAuthCollector:
             line: Log line containing successful SSH login
 
         Returns:
-            dict: Event dictionary
+            Event: The event
         """
-        try:
-            # Extract timestamp
-            timestamp = parse_syslog_timestamp(line)
-
-            # Extract username
-            # Pattern: "Accepted <method> for <username> from"
-            username_match = re.search(r'Accepted \w+ for (\S+) from', line)
-            if not username_match:
-                return None
-            username = username_match.group(1)
-
-            # Extract remote IP
-            # Pattern: "from <ip> port"
-            ip_match = re.search(r'from ([\d\.]+) port', line)
-            remote_ip = ip_match.group(1) if ip_match else "unknown"
-
-            # Extract authentication method (password, publickey, etc.)
-            method_match = re.search(r'Accepted (\w+) for', line)
-            auth_method = method_match.group(1) if method_match else "unknown"
-
-            # Extract port
-            port_match = re.search(r'port (\d+)', line)
-            port = int(port_match.group(1)) if port_match else None
-
-            # Create the event
-            return create_event(
-                category="remote_access",
-                event_type="ssh_login_success",
-                severity="info",
-                message=f"User {username} logged in via SSH from {remote_ip}",
-                source=os.path.basename(self.log_file),
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
-                timestamp=timestamp,
-                data={
-                    "username": username,
-                    "remote_ip": remote_ip,
-                    "auth_method": auth_method,
-                    "port": port,
-                    "protocol": "ssh"
-                }
-            )
+        # Extract timestamp
+        timestamp = self._parse_timestamp(line)
 
-        except Exception as e:
-            print(f"Error parsing SSH success: {e}")
+        # Extract method, username, remote IP and port in one pass
+        match = _SSH_ACCEPT_RE.search(line)
+        if not match:
             return None
-
-    def _parse_ssh_failure(self, line: str) -> Optional[Dict[str, Any]]:
+        auth_method = intern(match.group('method'))
+        username = intern(match.group('user'))
+        remote_ip = intern(match.group('ip') or "unknown")
+        port = match.group('port')
+        port = int(port) if port else None
+
+        # Create the event
+        return self._make_event(
+            category=_CAT_REMOTE,
+            event_type="ssh_login_success",
+            severity=_SEV_INFO,
+            message=f"User {username} logged in via SSH from {remote_ip}",
+            timestamp=timestamp,
+            data={
+                "username": username,
+                "remote_ip": remote_ip,
+                "auth_method": auth_method,
+                "port": port,
+                "protocol": _PROTO_SSH
+            }
+        )
+
+
+    def _parse_ssh_failure(self, line: str) -> Optional[Event]:
         """
         Parse a failed SSH login attempt.
 
@@ -238,69 +417,50 @@ class LinuxAuthCollector:
             line: Log line containing failed SSH login
 
         Returns:
-            dict: Event dictionary
+            Event: The event
         """
-        try:
-            # Extract timestamp
-            timestamp = parse_syslog_timestamp(line)
-
-            # Check if it's an invalid user
-            is_invalid_user = 'invalid user' in line
-
-            # Extract username
-            if is_invalid_user:
-                # Pattern: "invalid user <username> from"
-                username_match = re.search(r'invalid user (\S+) from', line)
-            else:
-                # Pattern: "for <username> from"
-                username_match = re.search(r'for (\S+) from', line)
-
-            if not username_match:
-                return None
-            username = username_match.group(1)
-
-            # Extract remote IP
-            ip_match = re.search(r'from ([\d\.]+) port', line)
-            remote_ip = ip_match.group(1) if ip_match else "unknown"
-
-            # Extract port
-            port_match = re.search(r'port (\d+)', line)
-            port = int(port_match.group(1)) if port_match else None
-
-            # Determine failure reason
-            if is_invalid_user:
-                reason = "Invalid user"
-            elif 'Failed password' in line:
-                reason = "Bad password"
-            else:
-                reason = "Authentication failed"
-
-            # Create the event
-            return create_event(
-                category="remote_access",
-                event_type="ssh_login_failed",
-                severity="warning",
-                message=f"Failed SSH login for {username} from {remote_ip} - {reason}",
-                source=os.path.basename(self.log_file),
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
-                timestamp=timestamp,
-                data={
-                    "username": username,
-                    "remote_ip": remote_ip,
-                    "port": port,
-                    "reason": reason,
-                    "invalid_user": is_invalid_user,
-                    "protocol": "ssh"
-                }
-            )
+        # Extract timestamp
+        timestamp = self._parse_timestamp(line)
 
-        except Exception as e:
-            print(f"Error parsing SSH failure: {e}")
-            return None
+        # Check if it's an invalid user
+        is_invalid_user = 'invalid user' in line
 
-    def _parse_sudo_command(self, line: str) -> Optional[Dict[str, Any]]:
+        # Extract username, remote IP and port in one pass
+        match = _SSH_FAIL_RE.search(line)
+        if not match:
+            return None
+        username = intern(match.group('user'))
+        remote_ip = intern(match.group('ip') or "unknown")
+        port = match.group('port')
+        port = int(port) if port else None
+
+        # Determine failure reason
+        if is_invalid_user:
+            reason = "Invalid user"
+        elif 'Failed password' in line:
+            reason = "Bad password"
+        else:
+            reason = "Authentication failed"
+
+        # Create the event
+        return self._make_event(
+            category=_CAT_REMOTE,
+            event_type="ssh_login_failed",
+            severity=_SEV_WARN,
+            message=f"Failed SSH login for {username} from {remote_ip} - {reason}",
+            timestamp=timestamp,
+            data={
+                "username": username,
+                "remote_ip": remote_ip,
+                "port": port,
+                "reason": reason,
+                "invalid_user": is_invalid_user,
+                "protocol": _PROTO_SSH
+            }
+        )
+
+
+    def _parse_sudo_command(self, line: str) -> Optional[Event]:
         """
         Parse a sudo command execution.
 
@@ -311,62 +471,41 @@ class LinuxAuthCollector:
             line: Log line containing sudo command
 
         Returns:
-            dict: Event dictionary
+            Event: The event
         """
-        try:
-            # Extract timestamp
-            timestamp = parse_syslog_timestamp(line)
-
-            # Extract username (who ran sudo)
-            # Pattern: "sudo: <username> :"
-            username_match = re.search(r'sudo:\s+(\S+)\s+:', line)
-            if not username_match:
-                return None
-            username = username_match.group(1)
-
-            # Extract command
-            # Pattern: "COMMAND=<command>"
-            command_match = re.search(r'COMMAND=(.+)$', line)
-            command = command_match.group(1).strip() if command_match else "unknown"
-
-            # Extract target user (who they became, usually root)
-            user_match = re.search(r'USER=(\S+)', line)
-            target_user = user_match.group(1) if user_match else "root"
-
-            # Extract TTY
-            tty_match = re.search(r'TTY=(\S+)', line)
-            tty = tty_match.group(1) if tty_match else "unknown"
-
-            # Extract working directory
-            pwd_match = re.search(r'PWD=(\S+)', line)
-            pwd = pwd_match.group(1) if pwd_match else "unknown"
-
-            # Create the event
-            return create_event(
-                category="privilege_escalation",
-                event_type="sudo_used",
-                severity="info",
-                message=f"User {username} used sudo to run: {command}",
-                source=os.path.basename(self.log_file),
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
-                timestamp=timestamp,
-                data={
-                    "username": username,
-                    "command": command,
-                    "target_user": target_user,
-                    "tty": tty,
-                    "pwd": pwd,
-                    "success": True  # If it's in the log, sudo succeeded
-                }
-            )
+        # Extract timestamp
+        timestamp = self._parse_timestamp(line)
 
-        except Exception as e:
-            print(f"Error parsing sudo command: {e}")
+        # Extract who ran sudo, TTY, working directory, target user
+        # (who they became, usually root) and command in one pass
+        match = _SUDO_RE.search(line)
+        if not match:
             return None
-
-    def _parse_su_command(self, line: str) -> Optional[Dict[str, Any]]:
+        username = intern(match.group('user'))
+        tty = match.group('tty') or "unknown"
+        pwd = match.group('pwd') or "unknown"
+        target_user = intern(match.group('target') or "root")
+        command = match.group('cmd').strip()
+
+        # Create the event
+        return self._make_event(
+            category=_CAT_PRIV,
+            event_type="sudo_used",
+            severity=_SEV_INFO,
+            message=f"User {username} used sudo to run: {command}",
+            timestamp=timestamp,
+            data={
+                "username": username,
+                "command": command,
+                "target_user": target_user,
+                "tty": tty,
+                "pwd": pwd,
+                "success": True  # If it's in the log, sudo succeeded
+            }
+        )
+
+
+    def _parse_su_command(self, line: str) -> Optional[Event]:
         """
         Parse a su (switch user) command.
 
@@ -377,61 +516,49 @@ class LinuxAuthCollector:
             line: Log line containing su command
 
         Returns:
-            dict: Event dictionary
+            Event: The event
         """
-        try:
-            # Extract timestamp
-            timestamp = parse_syslog_timestamp(line)
-
-            # Check if successful or failed
-            if 'FAILED' in line or 'authentication failure' in line:
-                success = False
-                severity = "warning"
-            else:
-                success = True
-                severity = "info"
-
-            # Extract target user
-            # Pattern: "(to <user>)"
-            target_match = re.search(r'\(to (\S+)\)', line)
-            target_user = target_match.group(1) if target_match else "root"
-
-            # Extract source user
-            # Pattern: ") <user> on"
-            user_match = re.search(r'\)\s+(\S+)\s+on', line)
-            username = user_match.group(1) if user_match else "unknown"
-
-            # Extract TTY
-            tty_match = re.search(r'on\s+(\S+)', line)
-            tty = tty_match.group(1) if tty_match else "unknown"
-
-            # Create the event
-            event_type = "su_success" if success else "su_failed"
-            message = f"User {username} {'switched to' if success else 'failed to switch to'} {target_user}"
-
-            return create_event(
-                category="privilege_escalation",
-                event_type=event_type,
-                severity=severity,
-                message=message,
-                source=os.path.basename(self.log_file),
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
-                timestamp=timestamp,
-                data={
-                    "username": username,
-                    "target_user": target_user,
-                    "tty": tty,
-                    "success": success
-                }
-            )
+        # Extract timestamp
+        timestamp = self._parse_timestamp(line)
 
-        except Exception as e:
-            print(f"Error parsing su command: {e}")
-            return None
-
-    def _parse_local_login(self, line: str) -> Optional[Dict[str, Any]]:
+        # Check if successful or failed
+        if 'FAILED' in line or 'authentication failure' in line:
+            success = False
+            severity = _SEV_WARN
+        else:
+            success = True
+            severity = _SEV_INFO
+
+        # Extract target user, source user and TTY in one pass
+        # Pattern: "(to <target>) <user> on <tty>"
+        match = _SU_RE.search(line)
+        if match:
+            target_user = intern(match.group('target'))
+            username = intern(match.group('user') or "unknown")
+            tty = match.group('tty') or "unknown"
+        else:
+            target_user, username, tty = "root", "unknown", "unknown"
+
+        # Create the event
+        event_type = "su_success" if success else "su_failed"
+        message = f"User {username} {'switched to' if success else 'failed to switch to'} {target_user}"
+
+        return self._make_event(
+            category=_CAT_PRIV,
+            event_type=event_type,
+            severity=severity,
+            message=message,
+            timestamp=timestamp,
+            data={
+                "username": username,
+                "target_user": target_user,
+                "tty": tty,
+                "success": success
+            }
+        )
+
+
+    def _parse_local_login(self, line: str) -> Optional[Event]:
         """
         Parse a local console/TTY login.
 
@@ -442,80 +569,155 @@ class LinuxAuthCollector:
             line: Log line containing local login
 
         Returns:
-            dict: Event dictionary
+            Event: The event
         """
-        try:
-            # Extract timestamp
-            timestamp = parse_syslog_timestamp(line)
-
-            # Determine if successful
-            if 'session opened' in line:
-                success = True
-                severity = "info"
-            elif 'FAILED' in line or 'authentication failure' in line:
-                success = False
-                severity = "warning"
-            else:
-                return None  # Not a login event we care about
-
-            # Extract username
-            username_match = re.search(r'for user (\S+)', line)
-            if not username_match:
-                username_match = re.search(r'user=(\S+)', line)
-            if not username_match:
-                return None
-            username = username_match.group(1)
-
-            # Create the event
-            event_type = "local_login_success" if success else "local_login_failed"
-            message = f"Local {'login' if success else 'login failed'} for user {username}"
-
-            return create_event(
-                category="authentication",
-                event_type=event_type,
-                severity=severity,
-                message=message,
-                source=os.path.basename(self.log_file),
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
-                timestamp=timestamp,
-                data={
-                    "username": username,
-                    "login_type": "local",
-                    "success": success
-                }
-            )
+        # Extract timestamp
+        timestamp = self._parse_timestamp(line)
+
+        # Determine if successful
+        if 'session opened' in line:
+            success = True
+            severity = _SEV_INFO
+        elif 'FAILED' in line or 'authentication failure' in line:
+            success = False
+            severity = _SEV_WARN
+        else:
+            return None  # Not a login event we care about
 
-        except Exception as e:
-            print(f"Error parsing local login: {e}")
+        # Extract username
+        # Pattern: "for user <username>" or "user=<username>"
+        username_match = _LOGIN_USER_RE.search(line)
+        if not username_match:
             return None
+        username = intern(username_match.group('user'))
+
+        # Create the event
+        event_type = "local_login_success" if success else "local_login_failed"
+        message = f"Local {'login' if success else 'login failed'} for user {username}"
+
+        return self._make_event(
+            category=_CAT_AUTH,
+            event_type=event_type,
+            severity=severity,
+            message=message,
+            timestamp=timestamp,
+            data={
+                "username": username,
+                "login_type": "local",
+                "success": success
+            }
+        )
+
 
 
 # ============================================================================
 # Main function - for easy testing
 # ============================================================================
 
-def collect_auth_events(log_file: str = None, max_lines: int = 1000) -> List[Dict[str, Any]]:
+def find_rotated_logs(log_file: str) -> List[str]:
+    """
+    Find a log file together with its uncompressed rotated copies.
+
+    Compressed rotations (auth.log.2.gz, ...) are skipped since the
+    collector reads plain text only.
+
+    Args:
+        log_file: Path to the current log file (e.g., /var/log/auth.log)
+
+    Returns:
+        list: Existing paths, oldest first (e.g., auth.log.2, auth.log.1, auth.log)
+    """
+    rotated = []
+    for path in glob.glob(f"{glob.escape(log_file)}.*"):
+        suffix = path[len(log_file) + 1:]
+        if suffix.isdigit():
+            rotated.append((int(suffix), path))
+
+    paths = [path for _, path in sorted(rotated, reverse=True)]
+    if os.path.exists(log_file):
+        paths.append(log_file)
+    return paths
+
+
+# One collector per log file (None for the auto-detected one), kept for
+# the life of the process so each collect_auth_events() call only reads
+# what was appended since the previous call
+_COLLECTORS: Dict[Optional[str], LinuxAuthCollector] = {}
+
+
+def _get_collector(log_file: Optional[str]) -> LinuxAuthCollector:
+    """Return the long-lived collector for log_file, creating it if needed."""
+    collector = _COLLECTORS.get(log_file)
+    if collector is None:
+        collector = _COLLECTORS[log_file] = LinuxAuthCollector(log_file)
+    return collector
+
+
+def _parse_file_worker(
+    log_file: str,
+    max_lines: int,
+    position: Optional[Tuple[int, int]]
+) -> Tuple[List[Event], Optional[Tuple[int, int]]]:
+    """
+    Collect events from a single log file (runs in a worker process).
+
+    The worker's collector doesn't outlive the call, so the read position
+    is passed in and handed back for the parent to keep.
+    """
+    collector = LinuxAuthCollector(log_file)
+    collector.last_position = position
+    events = collector.collect_events(max_lines)
+    return events, collector.last_position
+
+
+def collect_auth_events(
+    log_file: str = None,
+    max_lines: int = 1000,
+    log_files: List[str] = None
+) -> List[Event]:
     """
     Convenience function to collect authentication events.
 
     This is the main entry point that other parts of Loglumen will call.
+    The first call for a log file reads its most recent lines; later calls
+    only return events from lines appended since the previous call.
 
     Args:
         log_file: Path to auth log (optional, will auto-detect)
-        max_lines: Maximum number of recent log lines to process
+        max_lines: Maximum number of recent log lines to process (per file)
+        log_files: Several log files to collect from (e.g., the output of
+            find_rotated_logs()). They are parsed in parallel, one worker
+            process per file, and their events returned in the same order.
 
     Returns:
-        list: List of event dictionaries
+        list: List of Event objects
 
     Example:
         from collectors.linux.auth import collect_auth_events
         events = collect_auth_events()
         print(f"Found {len(events)} authentication events")
+
+        # Include rotated logs
+        events = collect_auth_events(log_files=find_rotated_logs("/var/log/auth.log"))
     """
-    collector = LinuxAuthCollector(log_file)
-    return collector.collect_events(max_lines)
+    if log_files and len(log_files) > 1:
+        collectors = [_get_collector(path) for path in log_files]
+        workers = min(len(log_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                _parse_file_worker,
+                log_files,
+                [max_lines] * len(log_files),
+                [collector.last_position for collector in collectors]
+            ))
+        for collector, (_, position) in zip(collectors, results):
+            collector.last_position = position
+        return list(chain.from_iterable(events for events, _ in results))
+
+    if log_files:
+        log_file = log_files[0]
+
+    return _get_collector(log_file).collect_events(max_lines)
 
 
 # ============================================================================
@@ -548,7 +750,7 @@ if __name__ == "__main__":
         print("-" * 70)
         for i, event in enumerate(events[:3], 1):
             print(f"\nEvent {i}:")
-            print(json.dumps(event, indent=2))
+            print(json.dumps(event.to_dict(), indent=2))
 
         # Print summary by event type
         print("\n" + "=" * 70)
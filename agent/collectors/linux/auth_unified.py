@@ -12,12 +12,21 @@ Usage:
     events = collect_auth_events()
 """
 
+import logging
 import os
 from typing import List, Dict, Any
 
 # Import both collectors
-from collectors.linux.auth import LinuxAuthCollector
-from collectors.linux.auth_journald import JournaldAuthCollector
+try:
+    from .auth import collect_auth_events as collect_logfile_events
+    from .auth_journald import collect_auth_events as collect_journald_events
+except ImportError:
+    # Not imported as part of the linux package (e.g. run directly as a
+    # script)
+    from auth import collect_auth_events as collect_logfile_events
+    from auth_journald import collect_auth_events as collect_journald_events
+
+logger = logging.getLogger(__name__)
 
 
 def collect_auth_events(
@@ -29,6 +38,9 @@ def collect_auth_events(
     """
     Collect authentication events using the best available method.
 
+    Log files are read incrementally: after the first call, only events
+    from lines appended since the previous call are returned.
+
     Args:
         log_file: Specific log file to use (optional)
         hours: For journald, how many hours back to search
@@ -51,18 +63,15 @@ def collect_auth_events(
 
     # If specific log file requested, use log file collector
     if log_file:
-        collector = LinuxAuthCollector(log_file)
-        return collector.collect_events(max_lines)
+        return collect_logfile_events(log_file, max_lines)
 
     # If journald preferred, use it
     if prefer_method == "journald":
-        collector = JournaldAuthCollector()
-        return collector.collect_events(hours, max_lines)
+        return collect_journald_events(hours, max_lines)
 
     # If logfile preferred, use it
     if prefer_method == "logfile":
-        collector = LinuxAuthCollector()
-        return collector.collect_events(max_lines)
+        return collect_logfile_events(max_lines=max_lines)
 
     # Auto-detect mode
     # Try log files first (faster and more reliable)
@@ -73,20 +82,21 @@ def collect_auth_events(
 
     for log_path in auth_logs:
         if os.path.exists(log_path) and os.access(log_path, os.R_OK):
-            print(f"Using log file: {log_path}")
-            collector = LinuxAuthCollector(log_path)
-            return collector.collect_events(max_lines)
+            logger.info("Using log file: %s", log_path)
+            return collect_logfile_events(log_path, max_lines)
 
     # No accessible log files, try journald
-    print("No accessible log files found, trying journald...")
-    collector = JournaldAuthCollector()
-    return collector.collect_events(hours, max_lines)
+    logger.info("No accessible log files found, trying journald...")
+    return collect_journald_events(hours, max_lines)
 
 
 if __name__ == "__main__":
     """Test the unified collector."""
     import json
 
+    # Show which collection method was picked
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("=" * 70)
     print("Unified Linux Authentication Collector")
     print("=" * 70)
@@ -98,7 +108,7 @@ if __name__ == "__main__":
 
     if events:
         print("First event:")
-        print(json.dumps(events[0], indent=2))
+        print(json.dumps(events[0], indent=2, default=lambda event: event.to_dict()))
 
         # Summary
         print("\nSummary by event type:")
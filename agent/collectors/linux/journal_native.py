@@ -0,0 +1,219 @@
+"""
+Native systemd Journal Reader
+
+Reads journal entries in-process through libsystemd's sd-journal API
+(via ctypes) instead of starting journalctl and parsing its output.
+Entries come back as dicts of field name -> value, the same shape
+journalctl -o json writes, so a collector can parse entries from
+either source the same way.
+
+If libsystemd can't be loaded, LIBSYSTEMD_AVAILABLE is False and
+collectors should fall back to journalctl; stream_journalctl() runs a
+journalctl query and hands back its output as it is written.
+
+Usage:
+    from collectors.linux.journal_native import LIBSYSTEMD_AVAILABLE, read_journal
+    if LIBSYSTEMD_AVAILABLE:
+        entries = read_journal(['PRIORITY=3'], max_entries=100)
+"""
+
+import ctypes
+import os
+import subprocess
+import threading
+import time
+from datetime import datetime
+from typing import List, Dict, Iterable, Iterator, Optional
+
+try:
+    from ..utils import EPOCH
+except ImportError:
+    # Not imported as part of the collectors package (e.g. imported as
+    # linux.journal_native by main.py, or run directly as a script)
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from utils import EPOCH
+
+# Try to load libsystemd (optional, journalctl is used without it)
+try:
+    _libsystemd = ctypes.CDLL('libsystemd.so.0')
+
+    _j = ctypes.c_void_p
+    _libsystemd.sd_journal_open.argtypes = [ctypes.POINTER(_j), ctypes.c_int]
+    _libsystemd.sd_journal_close.argtypes = [_j]
+    _libsystemd.sd_journal_close.restype = None
+    _libsystemd.sd_journal_add_match.argtypes = [_j, ctypes.c_char_p, ctypes.c_size_t]
+    _libsystemd.sd_journal_seek_tail.argtypes = [_j]
+    _libsystemd.sd_journal_previous.argtypes = [_j]
+    _libsystemd.sd_journal_get_realtime_usec.argtypes = [_j, ctypes.POINTER(ctypes.c_uint64)]
+    _libsystemd.sd_journal_get_data.argtypes = [
+        _j, ctypes.c_char_p, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t)
+    ]
+    _libsystemd.sd_journal_restart_data.argtypes = [_j]
+    _libsystemd.sd_journal_restart_data.restype = None
+    _libsystemd.sd_journal_enumerate_data.argtypes = [
+        _j, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t)
+    ]
+
+    LIBSYSTEMD_AVAILABLE = True
+except (OSError, AttributeError):
+    LIBSYSTEMD_AVAILABLE = False
+
+# Only open journal files of the local machine (what journalctl does
+# unless given --merge)
+SD_JOURNAL_LOCAL_ONLY = 1
+
+# Seconds before a journalctl query is abandoned
+JOURNALCTL_TIMEOUT = 30
+
+# Read journalctl's output in large chunks (a full pipe buffer is 64 KB)
+JOURNALCTL_BUFFER_SIZE = 64 * 1024
+
+
+def _check(result: int, call: str) -> int:
+    """Raise OSError for a negative errno returned by an sd_journal call."""
+    if result < 0:
+        raise OSError(-result, f"{call}: {os.strerror(-result)}")
+    return result
+
+
+def _split_field(data: ctypes.c_void_p, length: ctypes.c_size_t):
+    """Split a "FIELD=value" data object into its name and decoded value."""
+    name, _, value = ctypes.string_at(data, length.value).partition(b'=')
+    return name.decode('ascii', 'replace'), value.decode('utf-8', 'replace')
+
+
+def read_journal(
+    matches: Iterable[str],
+    since: Optional[datetime] = None,
+    max_entries: int = 1000,
+    fields: Optional[Iterable[str]] = None
+) -> List[Dict[str, str]]:
+    """
+    Read the most recent journal entries matching a filter.
+
+    Works like "journalctl --since SINCE -n MAX_ENTRIES MATCHES...":
+    matches on the same field are ORed together, matches on different
+    fields are ANDed, and the newest max_entries entries are returned,
+    oldest first. The filtering is done by the journal's own indexes.
+
+    Args:
+        matches: Field matches (e.g., ["PRIORITY=0", "PRIORITY=1"])
+        since: Skip entries older than this (naive UTC datetime)
+        max_entries: Maximum number of entries to return
+        fields: Fields to read from each entry (None reads them all)
+
+    Returns:
+        list: One dict of field name -> value per entry, with
+              __REALTIME_TIMESTAMP always set
+
+    Raises:
+        OSError: libsystemd isn't available or the journal couldn't be read
+    """
+    if not LIBSYSTEMD_AVAILABLE:
+        raise OSError("libsystemd is not available")
+
+    since_usec = None
+    if since is not None:
+        since_usec = int((since - EPOCH).total_seconds() * 1000000)
+
+    names = [name.encode('ascii') for name in fields] if fields is not None else None
+
+    journal = ctypes.c_void_p()
+    _check(_libsystemd.sd_journal_open(ctypes.byref(journal), SD_JOURNAL_LOCAL_ONLY),
+           "sd_journal_open")
+
+    entries = []
+    try:
+        for match in matches:
+            _check(_libsystemd.sd_journal_add_match(journal, match.encode(), 0),
+                   "sd_journal_add_match")
+
+        # Walk backwards from the newest entry, like journalctl -n does
+        _check(_libsystemd.sd_journal_seek_tail(journal), "sd_journal_seek_tail")
+
+        realtime = ctypes.c_uint64()
+        data = ctypes.c_void_p()
+        length = ctypes.c_size_t()
+
+        while len(entries) < max_entries:
+            if _check(_libsystemd.sd_journal_previous(journal), "sd_journal_previous") == 0:
+                break  # Reached the oldest entry
+
+            _check(_libsystemd.sd_journal_get_realtime_usec(journal, ctypes.byref(realtime)),
+                   "sd_journal_get_realtime_usec")
+            if since_usec is not None and realtime.value < since_usec:
+                break  # Everything further back is older still
+
+            entry = {'__REALTIME_TIMESTAMP': str(realtime.value)}
+
+            if names is None:
+                _libsystemd.sd_journal_restart_data(journal)
+                while _check(_libsystemd.sd_journal_enumerate_data(
+                        journal, ctypes.byref(data), ctypes.byref(length)),
+                        "sd_journal_enumerate_data") > 0:
+                    name, value = _split_field(data, length)
+                    entry[name] = value
+            else:
+                for field in names:
+                    # Fields an entry doesn't have are left out, the same
+                    # as in journalctl's output
+                    if _libsystemd.sd_journal_get_data(
+                            journal, field, ctypes.byref(data), ctypes.byref(length)) >= 0:
+                        name, value = _split_field(data, length)
+                        entry[name] = value
+
+            entries.append(entry)
+    finally:
+        _libsystemd.sd_journal_close(journal)
+
+    entries.reverse()
+    return entries
+
+
+def stream_journalctl(cmd: List[str], timeout: float = JOURNALCTL_TIMEOUT) -> Iterator[bytes]:
+    """
+    Run a journalctl query and yield its output lines as they arrive.
+
+    Lines are parsed while journalctl is still writing, so parsing
+    overlaps with the journal reads and the whole output is never held
+    in memory at once.
+
+    Args:
+        cmd: journalctl command line
+        timeout: Seconds before journalctl is killed
+
+    Yields:
+        bytes: One line of journalctl output (one record with -o json)
+
+    Raises:
+        subprocess.CalledProcessError: journalctl exited with an error
+        subprocess.TimeoutExpired: journalctl ran longer than timeout
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=JOURNALCTL_BUFFER_SIZE
+    )
+
+    # Kill journalctl if it runs too long; the read loop then sees EOF
+    started = time.monotonic()
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            yield line
+        proc.wait()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            # Stopped early by the caller
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+    if proc.returncode != 0:
+        if time.monotonic() - started >= timeout:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
@@ -16,16 +16,181 @@ Data sources:
 Author: Loglumen Team
 """
 
+import json
+import logging
 import os
 import re
 import subprocess
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
 # Import utilities
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import create_event, get_hostname, get_local_ip, parse_syslog_timestamp
+try:
+    from ..utils import (
+        EPOCH, Event, get_hostname, get_local_ip, parse_syslog_timestamp, read_tail_lines
+    )
+except ImportError:
+    # Not imported as part of the collectors package (e.g. imported as
+    # linux.service by main.py, or run directly as a script)
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from utils import (
+        EPOCH, Event, get_hostname, get_local_ip, parse_syslog_timestamp, read_tail_lines
+    )
+
+try:
+    from .journal_native import LIBSYSTEMD_AVAILABLE, read_journal, stream_journalctl
+except ImportError:
+    # Not imported as part of the linux package (e.g. run directly as a
+    # script)
+    from journal_native import LIBSYSTEMD_AVAILABLE, read_journal, stream_journalctl
+
+logger = logging.getLogger(__name__)
+
+# Seconds for which a repeat of the same kind of error is not logged
+# again (see _warn_once())
+ERROR_REPEAT_INTERVAL = 60
+
+# Try to import orjson (much faster JSON decoder, optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Decoder for journal records. Both accept the raw bytes read from
+# journalctl.
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Try to import Google's RE2 bindings (pip install google-re2)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Journal matches for reading the journal through libsystemd: priority
+# warning and above (matches on the same field are ORed)
+JOURNAL_PRIORITY_MATCHES = [f'PRIORITY={priority}' for priority in range(5)]
+
+# Message filter for journalctl queries: every entry _CLASSIFY_RE
+# accepts has one of these words in it. Plain alternation of lowercase
+# literals, so journalctl matches it case-insensitively.
+JOURNAL_GREP = 'failed|crashed|core dump|restart|error'
+
+# Fields _parse_journal_entry uses, read through libsystemd or requested
+# from journalctl with --output-fields (__REALTIME_TIMESTAMP is always
+# included)
+JOURNAL_FIELDS = [
+    'MESSAGE',
+    'SYSLOG_IDENTIFIER',
+    '_COMM',
+    '_PID',
+    'UNIT',
+    'USER_UNIT',
+    '_SYSTEMD_UNIT',
+]
+
+# Regexes used by the parsers, compiled once at import time instead of
+# going through re's pattern cache on every line. The extraction
+# patterns run on RE2's linear-time matcher when it is installed, so a
+# pathological line can't make them backtrack; the classifiers further
+# down use lookaheads, which RE2 doesn't support, and always use re.
+_regex = re2 if RE2_AVAILABLE else re
+
+# Unit name: "nginx.service: Failed with result 'exit-code'."
+_RE_SERVICE = _regex.compile(r'([a-zA-Z0-9_\-\.]+)\.service')
+
+# Failure details, either order: reason ("... Failed with result
+# 'exit-code'.") and exit code ("... code=exited, status=1/FAILURE")
+_RE_FAILURE_DETAILS = _regex.compile(r"result '(?P<reason>[^']+)'|code=(?P<exit_code>\w+)")
+
+# Signal number: "... crashed with signal 11"
+_RE_SIGNAL = _regex.compile(r'signal (\d+)')
+
+# Program tag and message: "hostname service: message" or
+# "hostname service[pid]: message"
+_RE_SERVICE_MESSAGE = _regex.compile(r'\s([a-zA-Z0-9_\-\.]+)(?:\[\d+\])?:\s+(.+)')
+
+# Crash left a core dump ("core dumped", "dumped core", ...)
+_RE_CORE = _regex.compile(r'(?i)core')
+
+# Line starts with an ISO timestamp (RFC 3339 syslog format)
+_RE_ISO_TS = _regex.compile(r'^\d{4}-\d{2}-\d{2}T')
+
+# Classifies a journal entry in one case-insensitive pass. Each branch
+# is a set of lookaheads for keywords that may appear anywhere in the
+# line; branches are tried in order, so a line matching several of them
+# is classified by the first, and the name of the group that matched
+# tells _parse_journal_entry which parser to use.
+_CLASSIFY_RE = re.compile(
+    r'(?is)'
+    r'(?P<failure>(?=.*failed)(?=.*(?:\.service|unit)))'
+    r'|(?P<crash>(?=.*(?:crashed|core dump)))'
+    r'|(?P<restart_limit>(?=.*restart)(?=.*(?:limit|too)))'
+    r'|(?P<error>(?=.*error)(?=.*(?:systemd|init|service)))'
+)
+
+# Syslog line reporting an error, failure or crash from one of the
+# common daemons we watch
+_SYSLOG_SERVICE_RE = re.compile(
+    r'(?is)(?=.*(?:error|failed|crash))'
+    r'.*(?:systemd|nginx|apache|mysql|postgresql|redis|docker|sshd|cron|rsyslog)'
+)
+
+
+# Programs whose error messages are not service errors
+_NON_SERVICE = frozenset({'kernel', 'systemd-journald', 'systemd-logind'})
+
+
+def _unit_name(entry: Dict[str, Any], message: str) -> Optional[str]:
+    """
+    Work out which service a journal entry is about.
+
+    systemd logs about a unit from its own process, so the unit is named
+    in the UNIT field (or the message), not in _SYSTEMD_UNIT. Entries
+    logged by the service itself only have _SYSTEMD_UNIT.
+
+    Args:
+        entry: Journal entry fields
+        message: The entry's MESSAGE
+
+    Returns:
+        str: Service name without the ".service" suffix, or None
+    """
+    unit = entry.get('UNIT') or entry.get('USER_UNIT')
+    if isinstance(unit, str) and unit.endswith('.service'):
+        return unit[:-len('.service')]
+
+    service_match = _RE_SERVICE.search(message)
+    if service_match:
+        return service_match.group(1)
+
+    unit = entry.get('_SYSTEMD_UNIT')
+    if isinstance(unit, str) and unit.endswith('.service'):
+        return unit[:-len('.service')]
+
+    return None
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_timestamp(timestamp_str: str) -> datetime:
+    """
+    Parse the ISO timestamp at the start of a log line.
+
+    Cached because failures come in bursts: a service that fails
+    usually logs several lines within the same second.
+
+    Args:
+        timestamp_str: Timestamp (e.g., "2025-11-16T10:30:00+0000")
+
+    Returns:
+        datetime: Parsed timestamp
+    """
+    return datetime.fromisoformat(timestamp_str.replace('+0000', ''))
 
 
 class LinuxServiceCollector:
@@ -33,12 +198,19 @@ class LinuxServiceCollector:
     Collects service failure and daemon crash events.
     """
 
+    # Whether this system's journalctl supports --grep; probed once per
+    # process by _grep_supported()
+    _HAS_GREP: Optional[bool] = None
+
     def __init__(self):
         """Initialize the collector."""
         self.hostname = get_hostname()
         self.host_ip = get_local_ip()
 
-    def collect_events(self, hours: int = 24, max_lines: int = 1000) -> List[Dict[str, Any]]:
+        # (parser or source, exception type) -> when that error was last logged
+        self._err_cache: Dict[Tuple[str, str], float] = {}
+
+    def collect_events(self, hours: int = 24, max_lines: int = 1000) -> List[Event]:
         """
         Collect service failure events.
 
@@ -47,22 +219,30 @@ class LinuxServiceCollector:
             max_lines: Maximum entries to process
 
         Returns:
-            list: List of event dictionaries
+            list: List of Event objects
         """
         events = []
 
-        # Try journald first (best for systemd systems)
-        journald_events = self._collect_from_journald(hours, max_lines)
-        events.extend(journald_events)
+        # Syslog is only parsed when journald comes up short, but reading
+        # its tail in a background thread overlaps the file I/O with the
+        # journald query instead of waiting for one after the other
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            syslog_read = pool.submit(self._read_syslog, max_lines)
 
-        # If no journald or few events, try syslog
-        if len(events) < 5:
-            syslog_events = self._collect_from_syslog(max_lines)
-            events.extend(syslog_events)
+            # Try journald first (best for systemd systems)
+            journald_events = self._collect_from_journald(hours, max_lines)
+            events.extend(journald_events)
+
+            # If no journald or few events, try syslog
+            if len(events) < 5:
+                syslog_events = self._parse_syslog(syslog_read.result())
+                events.extend(syslog_events)
+            else:
+                syslog_read.cancel()  # Not needed; skip it if not started
 
         return events
 
-    def _collect_from_journald(self, hours: int, max_lines: int) -> List[Dict[str, Any]]:
+    def _collect_from_journald(self, hours: int, max_lines: int) -> List[Event]:
         """
         Collect service events from systemd journal.
 
@@ -73,6 +253,22 @@ class LinuxServiceCollector:
         """
         events = []
 
+        # Read the journal in-process through libsystemd when we can: no
+        # journalctl process to start and no output to decode
+        if LIBSYSTEMD_AVAILABLE:
+            try:
+                entries = read_journal(
+                    JOURNAL_PRIORITY_MATCHES,
+                    since=datetime.utcnow() - timedelta(hours=hours),
+                    max_entries=max_lines,
+                    fields=JOURNAL_FIELDS
+                )
+            except OSError:
+                pass  # Fall back to journalctl
+            else:
+                events.extend(filter(None, map(self._parse_journal_entry, entries)))
+                return events
+
         # Check if journalctl is available
         try:
             subprocess.run(['journalctl', '--version'],
@@ -82,154 +278,218 @@ class LinuxServiceCollector:
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
             return events  # journalctl not available
 
-        # Query for service failures
+        # Query for service failures. One query covers everything: unit
+        # failures and restart limit hits are logged by systemd at warning
+        # priority, and which lines are relevant is decided in Python by
+        # _parse_journald_line anyway.
         try:
             cmd = [
                 'journalctl',
                 '--since', f'{hours}h ago',
                 '-n', str(max_lines),
                 '--no-pager',
-                '-o', 'short-iso',
-                '-p', 'err',  # Priority: error and above
+                '-o', 'json',
+                '-p', 'warning',  # Priority: warning and above
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0 and result.stdout:
-                for line in result.stdout.split('\n'):
-                    event = self._parse_journald_line(line)
-                    if event:
-                        events.append(event)
-
-        except Exception as e:
-            print(f"Error querying journald: {e}")
-
-        # Also query specifically for systemd unit failures
-        try:
-            cmd = [
-                'journalctl',
-                '--since', f'{hours}h ago',
-                '-n', str(max_lines),
-                '--no-pager',
-                '-o', 'short-iso',
-                '-u', '*.service',  # All services
-                '--grep', 'failed|crashed|stopped'
+            # Let journalctl drop entries that can't be service failures
+            # before they are formatted and sent to us
+            if self._grep_supported():
+                cmd += ['--grep', JOURNAL_GREP]
+
+            # Queries to try in order, until one runs. --output-fields
+            # keeps journalctl from formatting every other field of each
+            # entry into the JSON only for us to throw it away.
+            queries = [
+                cmd + ['--output-fields', ','.join(JOURNAL_FIELDS)],
+                # journalctl older than 236 has no --output-fields
+                cmd,
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            # Hot loop: bind lookups to locals once
+            parse = self._parse_journald_line
+            append = events.append
 
-            if result.returncode == 0 and result.stdout:
-                for line in result.stdout.split('\n'):
-                    event = self._parse_journald_line(line)
-                    if event and not any(e.get('data', {}).get('service_name') ==
-                                        event.get('data', {}).get('service_name') and
-                                        e.get('time') == event.get('time')
-                                        for e in events):
-                        events.append(event)
+            for query in queries:
+                lines_read = 0
+                try:
+                    for line in stream_journalctl(query):
+                        lines_read += 1
+                        event = parse(line)
+                        if event:
+                            append(event)
+                    break
+                except subprocess.CalledProcessError:
+                    if lines_read:
+                        raise
 
-        except Exception:
-            pass  # Grep might not be supported on older journalctl
+        except Exception as e:
+            self._warn_once(('journald', type(e).__name__), f"Error querying journald: {e}")
 
         return events
 
-    def _collect_from_syslog(self, max_lines: int) -> List[Dict[str, Any]]:
+    @classmethod
+    def _grep_supported(cls) -> bool:
+        """
+        Check whether journalctl supports --grep.
+
+        It needs systemd 237+ built with PCRE2. The answer can't change
+        while we run, so journalctl is only asked once per process.
+
+        Returns:
+            bool: True if --grep can be used
+        """
+        if cls._HAS_GREP is None:
+            try:
+                result = subprocess.run(
+                    ['journalctl', '--grep', JOURNAL_GREP, '-n', '0', '--quiet', '--no-pager'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5
+                )
+                cls._HAS_GREP = result.returncode == 0
+            except (OSError, subprocess.TimeoutExpired):
+                cls._HAS_GREP = False
+
+        return cls._HAS_GREP
+
+    def _collect_from_syslog(self, max_lines: int) -> List[Event]:
         """Collect service events from syslog."""
-        events = []
+        return self._parse_syslog(self._read_syslog(max_lines))
+
+    def _read_syslog(self, max_lines: int) -> Optional[bytes]:
+        """
+        Read the last max_lines lines of the first readable syslog.
 
+        Returns:
+            bytes: The raw lines, or None if there is no readable syslog
+        """
         syslog_paths = ['/var/log/syslog', '/var/log/messages']
 
         for log_path in syslog_paths:
             if os.path.exists(log_path) and os.access(log_path, os.R_OK):
                 try:
-                    with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-                        recent_lines = lines[-max_lines:] if len(lines) > max_lines else lines
-
-                        for line in recent_lines:
-                            event = self._parse_syslog_line(line)
-                            if event:
-                                events.append(event)
+                    # Only the end of the file is read, back to the first
+                    # of the last max_lines lines
+                    recent, _ = read_tail_lines(log_path, max_lines, include_partial=True)
+                    return recent
 
                 except Exception as e:
-                    print(f"Error reading {log_path}: {e}")
+                    self._warn_once((log_path, type(e).__name__), f"Error reading {log_path}: {e}")
 
                 break  # Use first available log
 
-        return events
+        return None
+
+    def _parse_syslog(self, recent: Optional[bytes]) -> List[Event]:
+        """Parse raw syslog lines from _read_syslog() for service events."""
+        if not recent:
+            return []
+
+        # A flapping service can log the same line many times over;
+        # identical lines (timestamp included) are only parsed once.
+        # dict.fromkeys drops the repeats and keeps the order.
+        lines = dict.fromkeys(recent.decode('utf-8', 'ignore').split('\n'))
 
-    def _parse_journald_line(self, line: str) -> Optional[Dict[str, Any]]:
-        """Parse a journald entry for service failures."""
-        if not line.strip() or line.startswith('--') or line.startswith('Hint:'):
+        return list(filter(None, map(self._parse_syslog_line, lines)))
+
+    def _parse_journald_line(self, line: bytes) -> Optional[Event]:
+        """Parse one journalctl -o json record for service failures."""
+        if not line.strip():
             return None
 
-        line_lower = line.lower()
+        try:
+            entry = _json_loads(line)
+        except ValueError as e:
+            self._warn_once(('journal entry', type(e).__name__), f"Error parsing journal entry: {e}")
+            return None
+
+        return self._parse_journal_entry(entry)
+
+    def _parse_journal_entry(self, entry: Dict[str, Any]) -> Optional[Event]:
+        """
+        Parse a journal entry for service failures.
+
+        Timestamp, program, PID and unit come straight from the entry's
+        fields; only the message text itself is searched with regexes.
+
+        Args:
+            entry: Journal entry fields (as written by journalctl -o json)
+
+        Returns:
+            Event: The event, or None if the entry isn't relevant
+        """
+        message = entry.get('MESSAGE')
+        if not isinstance(message, str):
+            return None  # No message, or a binary one (a list of byte values)
+
+        program = entry.get('SYSLOG_IDENTIFIER') or entry.get('_COMM') or 'unknown'
+
+        # Classify "program: message", the part of a log line the
+        # keywords are looked for in
+        match = _CLASSIFY_RE.match(f"{program}: {message}")
+
+        if match is None:
+            return None
+
+        kind = match.lastgroup
+        timestamp = self._journal_timestamp(entry)
 
         # Service failure patterns
-        if 'failed' in line_lower and ('.service' in line_lower or 'unit' in line_lower):
-            return self._parse_service_failure(line)
+        if kind == 'failure':
+            return self._parse_service_failure(entry, message, timestamp)
 
-        elif 'crashed' in line_lower or 'core dump' in line_lower:
-            return self._parse_service_crash(line)
+        elif kind == 'crash':
+            return self._parse_service_crash(entry, program, message, timestamp)
 
-        elif 'restart' in line_lower and ('limit' in line_lower or 'too' in line_lower):
-            return self._parse_service_restart_limit(line)
+        elif kind == 'restart_limit':
+            return self._parse_service_restart_limit(entry, message, timestamp)
 
-        elif 'error' in line_lower and any(daemon in line_lower for daemon in ['systemd', 'init', 'service']):
-            return self._parse_service_error(line)
+        elif kind == 'error':
+            return self._service_error_event(program, message.strip(), timestamp, "journald")
 
         return None
 
-    def _parse_syslog_line(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_syslog_line(self, line: str) -> Optional[Event]:
         """Parse a syslog entry for service failures."""
         if not line.strip():
             return None
 
-        line_lower = line.lower()
-
-        # Look for service-related errors
-        if ('error' in line_lower or 'failed' in line_lower or 'crash' in line_lower):
-            # Filter for service names (common daemons)
-            service_keywords = ['systemd', 'nginx', 'apache', 'mysql', 'postgresql',
-                              'redis', 'docker', 'sshd', 'cron', 'rsyslog']
-
-            if any(keyword in line_lower for keyword in service_keywords):
-                return self._parse_service_error(line)
+        # Look for service-related errors from common daemons
+        if _SYSLOG_SERVICE_RE.match(line):
+            return self._parse_service_error(line)
 
         return None
 
-    def _parse_service_failure(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_service_failure(self, entry: Dict[str, Any], message: str,
+                               timestamp: datetime) -> Optional[Event]:
         """
         Parse systemd service failure.
 
-        Example:
-        2025-11-16T10:30:00+0000 hostname systemd[1]: nginx.service: Failed with result 'exit-code'.
+        Example message (UNIT=nginx.service):
+        nginx.service: Failed with result 'exit-code'.
         """
         try:
-            timestamp = self._extract_timestamp(line)
-
             # Extract service name
-            service_match = re.search(r'([a-zA-Z0-9_\-\.]+)\.service', line)
-            if not service_match:
+            service_name = _unit_name(entry, message)
+            if not service_name:
                 return None
-            service_name = service_match.group(1)
-
-            # Extract failure reason
-            reason_match = re.search(r"result '([^']+)'", line)
-            reason = reason_match.group(1) if reason_match else "unknown"
 
-            # Extract exit code if present
-            exit_code_match = re.search(r'code=(\w+)', line)
-            exit_code = exit_code_match.group(1) if exit_code_match else None
-
-            return create_event(
-                category="service",
+            # Extract failure reason and exit code (if present) in one scan,
+            # keeping the first of each
+            reason = exit_code = None
+            for detail in _RE_FAILURE_DETAILS.finditer(message):
+                if detail.lastgroup == 'reason':
+                    reason = reason or detail.group('reason')
+                else:
+                    exit_code = exit_code or detail.group('exit_code')
+            reason = reason or "unknown"
+
+            return self._make_event(
                 event_type="service_failed",
                 severity="error",
                 message=f"Service {service_name} failed: {reason}",
                 source="journald",
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
                 timestamp=timestamp,
                 data={
                     "service_name": service_name,
@@ -240,76 +500,63 @@ class LinuxServiceCollector:
             )
 
         except Exception as e:
-            print(f"Error parsing service failure: {e}")
+            self._warn_once(('service failure', type(e).__name__), f"Error parsing service failure: {e}")
             return None
 
-    def _parse_service_crash(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_service_crash(self, entry: Dict[str, Any], program: str, message: str,
+                             timestamp: datetime) -> Optional[Event]:
         """
         Parse service crash.
 
-        Example:
-        2025-11-16T11:00:00+0000 hostname kernel: nginx[12345]: crashed with signal 11
+        Example message (SYSLOG_IDENTIFIER=nginx, _PID=12345):
+        crashed with signal 11
         """
         try:
-            timestamp = self._extract_timestamp(line)
+            # The crashed service is the program that logged the entry
+            service_name = program
 
-            # Extract service/process name
-            service_match = re.search(r'\s([a-zA-Z0-9_\-\.]+)\[\d+\].*crash', line)
-            service_name = service_match.group(1) if service_match else "unknown"
-
-            # Extract PID
-            pid_match = re.search(r'\[(\d+)\]', line)
-            pid = int(pid_match.group(1)) if pid_match else None
+            pid = entry.get('_PID')
+            pid = int(pid) if isinstance(pid, str) and pid.isdigit() else None
 
             # Extract signal if present
-            signal_match = re.search(r'signal (\d+)', line)
+            signal_match = _RE_SIGNAL.search(message)
             signal = signal_match.group(1) if signal_match else None
 
-            return create_event(
-                category="service",
+            return self._make_event(
                 event_type="service_crashed",
                 severity="error",
                 message=f"Service {service_name} crashed (PID {pid})",
-                source=self._get_source(line),
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
+                source="journald",
                 timestamp=timestamp,
                 data={
                     "service_name": service_name,
                     "pid": pid,
                     "signal": signal,
-                    "crash_type": "core_dump" if 'core' in line.lower() else "crash"
+                    "crash_type": "core_dump" if _RE_CORE.search(message) else "crash"
                 }
             )
 
         except Exception as e:
-            print(f"Error parsing service crash: {e}")
+            self._warn_once(('service crash', type(e).__name__), f"Error parsing service crash: {e}")
             return None
 
-    def _parse_service_restart_limit(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_service_restart_limit(self, entry: Dict[str, Any], message: str,
+                                     timestamp: datetime) -> Optional[Event]:
         """
         Parse service restart limit exceeded.
 
-        Example:
-        2025-11-16T12:00:00+0000 hostname systemd[1]: mysql.service: Start request repeated too quickly.
+        Example message (UNIT=mysql.service):
+        mysql.service: Start request repeated too quickly.
         """
         try:
-            timestamp = self._extract_timestamp(line)
-
             # Extract service name
-            service_match = re.search(r'([a-zA-Z0-9_\-\.]+)\.service', line)
-            service_name = service_match.group(1) if service_match else "unknown"
+            service_name = _unit_name(entry, message) or "unknown"
 
-            return create_event(
-                category="service",
+            return self._make_event(
                 event_type="service_restart_limit",
                 severity="warning",
                 message=f"Service {service_name} restart limit exceeded",
                 source="journald",
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
                 timestamp=timestamp,
                 data={
                     "service_name": service_name,
@@ -319,12 +566,12 @@ class LinuxServiceCollector:
             )
 
         except Exception as e:
-            print(f"Error parsing restart limit: {e}")
+            self._warn_once(('restart limit', type(e).__name__), f"Error parsing restart limit: {e}")
             return None
 
-    def _parse_service_error(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_service_error(self, line: str) -> Optional[Event]:
         """
-        Parse general service error.
+        Parse general service error from a syslog line.
 
         Example:
         Nov 16 13:00:00 hostname nginx: Error: configuration file test failed
@@ -334,7 +581,7 @@ class LinuxServiceCollector:
 
             # Try to extract service name from the log line
             # Format: "hostname service: message" or "hostname service[pid]: message"
-            service_match = re.search(r'\s([a-zA-Z0-9_\-\.]+)(?:\[\d+\])?:\s+(.+)', line)
+            service_match = _RE_SERVICE_MESSAGE.search(line)
 
             if not service_match:
                 return None
@@ -342,38 +589,98 @@ class LinuxServiceCollector:
             service_name = service_match.group(1)
             error_msg = service_match.group(2).strip()
 
-            # Filter out non-services (like kernel, systemd journald, etc.)
-            if service_name in ['kernel', 'systemd-journald', 'systemd-logind']:
-                return None
-
-            return create_event(
-                category="service",
-                event_type="service_error",
-                severity="warning",
-                message=f"Service {service_name} error: {error_msg[:80]}",
-                source=self._get_source(line),
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
-                timestamp=timestamp,
-                data={
-                    "service_name": service_name,
-                    "error_message": error_msg,
-                    "error_type": "application_error"
-                }
-            )
+            return self._service_error_event(service_name, error_msg, timestamp,
+                                             self._get_source(line))
 
         except Exception as e:
-            print(f"Error parsing service error: {e}")
+            self._warn_once(('service error', type(e).__name__), f"Error parsing service error: {e}")
             return None
 
+    def _service_error_event(self, service_name: str, error_msg: str, timestamp: datetime,
+                             source: str) -> Optional[Event]:
+        """
+        Build a general service error event.
+
+        Args:
+            service_name: Program that logged the error
+            error_msg: The error message
+            timestamp: When the error was logged
+            source: "journald" or "syslog"
+
+        Returns:
+            Event: The event, or None if the program isn't a service
+        """
+        # Filter out non-services (like kernel, systemd journald, etc.)
+        if service_name in _NON_SERVICE:
+            return None
+
+        return self._make_event(
+            event_type="service_error",
+            severity="warning",
+            message=f"Service {service_name} error: {error_msg[:80]}",
+            source=source,
+            timestamp=timestamp,
+            data={
+                "service_name": service_name,
+                "error_message": error_msg,
+                "error_type": "application_error"
+            }
+        )
+
+    def _make_event(
+        self,
+        event_type: str,
+        severity: str,
+        message: str,
+        source: str,
+        timestamp: datetime,
+        data: Dict[str, Any]
+    ) -> Event:
+        """
+        Build an event for this collector.
+
+        The fields that never change for this collector (host, IP) are
+        filled in from values cached on the instance.
+
+        Returns:
+            Event: The event
+        """
+        return Event(
+            "service",
+            event_type,
+            severity,
+            message,
+            source,
+            "linux",
+            data,
+            self.hostname,
+            self.host_ip,
+            timestamp
+        )
+
+    def _warn_once(self, key: Tuple[str, str], msg: str) -> None:
+        """Log msg as a warning, at most once per key every ERROR_REPEAT_INTERVAL seconds."""
+        now = time.monotonic()
+        last = self._err_cache.get(key)
+        if last is not None and now - last < ERROR_REPEAT_INTERVAL:
+            return
+
+        self._err_cache[key] = now
+        logger.warning(msg)
+
+    def _journal_timestamp(self, entry: Dict[str, Any]) -> datetime:
+        """Get a journal entry's timestamp (UTC) from __REALTIME_TIMESTAMP."""
+        realtime = entry.get('__REALTIME_TIMESTAMP')
+        if isinstance(realtime, str) and realtime.isdigit():
+            return EPOCH + timedelta(microseconds=int(realtime))
+        return datetime.utcnow()
+
     def _extract_timestamp(self, line: str) -> datetime:
         """Extract timestamp from log line."""
         try:
-            # Journald format (ISO timestamp)
-            if re.match(r'^\d{4}-\d{2}-\d{2}T', line):
-                timestamp_str = line.split()[0]
-                return datetime.fromisoformat(timestamp_str.replace('+0000', ''))
+            # ISO timestamp
+            if _RE_ISO_TS.match(line):
+                return _parse_iso_timestamp(line.split()[0])
             else:
                 # Syslog format
                 return parse_syslog_timestamp(line)
@@ -382,12 +689,12 @@ class LinuxServiceCollector:
 
     def _get_source(self, line: str) -> str:
         """Determine log source."""
-        if 'journald' in line or re.match(r'^\d{4}-\d{2}-\d{2}T', line):
+        if 'journald' in line or _RE_ISO_TS.match(line):
             return "journald"
         return "syslog"
 
 
-def collect_service_events(hours: int = 24, max_lines: int = 1000) -> List[Dict[str, Any]]:
+def collect_service_events(hours: int = 24, max_lines: int = 1000) -> List[Event]:
     """
     Convenience function to collect service failure events.
 
@@ -396,7 +703,7 @@ def collect_service_events(hours: int = 24, max_lines: int = 1000) -> List[Dict[
         max_lines: Maximum entries to process
 
     Returns:
-        list: List of event dictionaries
+        list: List of Event objects
 
     Example:
         events = collect_service_events(hours=24)
@@ -423,7 +730,7 @@ if __name__ == "__main__":
         print("Sample events:")
         for i, event in enumerate(events[:3], 1):
             print(f"\nEvent {i}:")
-            print(json.dumps(event, indent=2))
+            print(json.dumps(event.to_dict(), indent=2))
 
         # Summary
         print("\n" + "=" * 70)
@@ -23,15 +23,233 @@ Log locations:
 Author: Loglumen Team
 """
 
+import logging
 import os
 import re
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 
 # Import utilities
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import create_event, get_hostname, get_local_ip
+try:
+    from ..utils import MONTHS, Event, get_hostname, get_local_ip, read_tail_lines
+except ImportError:
+    # Not imported as part of the collectors package (e.g. imported as
+    # linux.software by main.py, or run directly as a script)
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from utils import MONTHS, Event, get_hostname, get_local_ip, read_tail_lines
+
+# Read errors, parse errors and missing logs are reported through the
+# logging module instead of print()
+logger = logging.getLogger(__name__)
+
+# A malformed stretch of log fails the same way on every line, so an
+# error of the same kind from the same parser is only logged once per
+# this many seconds
+ERROR_REPEAT_INTERVAL = 60
+
+# Package patterns, compiled once at import instead of on every log line.
+# Lines are parsed as raw bytes (only the fields that end up in an event
+# are decoded), so these patterns and the map keys below are bytes too.
+# apt history: "nginx:amd64 (1.18.0-1ubuntu1)"
+_APT_PKG_RE = re.compile(rb'([a-zA-Z0-9\-.\_]+)(?:\:\w+)?\s*\(([^)]+)\)')
+# yum/dnf: "Installed: nginx-1.18.0-1.el8.x86_64"
+_YUM_PKG_RE = re.compile(rb'(Installed|Updated|Erased|Removed):\s+(\S+)')
+# yum/dnf package: "nginx-1.18.0-1.el8.x86_64" -> name, version-release
+_YUM_NVR_RE = re.compile(rb'^(.+)-([^-]+-[^-]+)\.[^.]+$')
+
+# Month abbreviations used in yum/dnf (syslog-style) timestamps, as bytes
+_MONTHS = {name.encode('ascii'): month for name, month in MONTHS.items()}
+
+# Log action -> event fields, one dict lookup per line instead of an
+# if/elif chain of string comparisons
+# dpkg action -> (event_type, severity); configure, trigproc, etc. are skipped
+_DPKG_ACTION_MAP = {
+    b'install': ('software_installed', 'info'),
+    b'upgrade': ('software_updated', 'info'),
+    b'update': ('software_updated', 'info'),
+    b'remove': ('software_removed', 'info'),
+    b'purge': ('software_removed', 'info'),
+}
+# apt history line prefix -> (action, event_type)
+_APT_ACTION_MAP = {
+    b'Install': ('install', 'software_installed'),
+    b'Upgrade': ('upgrade', 'software_updated'),
+    b'Remove': ('remove', 'software_removed'),
+}
+# Only lines starting with one of these can be an apt event
+_APT_ACTION_PREFIXES = tuple(prefix + b':' for prefix in _APT_ACTION_MAP)
+# yum/dnf keyword -> (action, event_type)
+_YUM_ACTION_MAP = {
+    b'Installed': ('install', 'software_installed'),
+    b'Updated': ('update', 'software_updated'),
+    b'Erased': ('remove', 'software_removed'),
+    b'Removed': ('remove', 'software_removed'),
+}
+# pacman keyword -> (action, event_type)
+_PACMAN_ACTION_MAP = {
+    b'installed': ('install', 'software_installed'),
+    b'reinstalled': ('install', 'software_installed'),
+    b'upgraded': ('upgrade', 'software_updated'),
+    b'removed': ('remove', 'software_removed'),
+}
+
+
+def _pacman_timestamp(ts: bytes) -> datetime:
+    """
+    Parse a pacman log timestamp into a naive UTC datetime.
+
+    pacman writes a fixed layout ("2025-11-16T10:30:00+0000"), so the
+    fields and the UTC offset are sliced out directly. Anything else
+    (older logs without an offset, say) goes through fromisoformat().
+
+    Args:
+        ts: Timestamp from between the brackets at the start of a line
+
+    Returns:
+        datetime: Timestamp in UTC
+    """
+    sign = ts[19:20]
+    if len(ts) == 24 and (sign == b'+' or sign == b'-'):
+        try:
+            local = datetime(
+                int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                int(ts[11:13]), int(ts[14:16]), int(ts[17:19])
+            )
+            offset = timedelta(hours=int(ts[20:22]), minutes=int(ts[22:24]))
+            return local - offset if sign == b'+' else local + offset
+        except ValueError:
+            pass
+
+    timestamp_str = ts.decode('utf-8', 'ignore')
+    if len(timestamp_str) == 24 and timestamp_str[19] in '+-':
+        # "+0000" -> "+00:00", which fromisoformat accepts on all
+        # Python versions
+        timestamp_str = f"{timestamp_str[:22]}:{timestamp_str[22:]}"
+    timestamp = datetime.fromisoformat(timestamp_str)
+    if timestamp.tzinfo is not None:
+        # Events carry naive UTC times
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+@lru_cache(maxsize=1)
+def _detect_package_manager() -> str:
+    """
+    Detect which package manager is used on this system.
+
+    The result is cached for the life of the process, so creating a new
+    collector every collection cycle doesn't stat the same binaries again.
+    """
+    # Check for existence of package manager commands
+    if os.path.exists('/usr/bin/apt') or os.path.exists('/usr/bin/dpkg'):
+        return 'apt'
+    elif os.path.exists('/usr/bin/dnf'):
+        return 'dnf'
+    elif os.path.exists('/usr/bin/yum'):
+        return 'yum'
+    elif os.path.exists('/usr/bin/pacman'):
+        return 'pacman'
+    elif os.path.exists('/usr/bin/zypper'):
+        return 'zypper'
+    return 'unknown'
+
+
+@lru_cache(maxsize=1)
+def _get_log_files(package_manager: str) -> Tuple[str, ...]:
+    """
+    Get the package manager log files to check.
+
+    Cached like _detect_package_manager(), so a log that first appears
+    after the agent started is only picked up after a restart.
+    """
+    log_files = []
+
+    # APT/DPKG logs (Ubuntu/Debian)
+    if package_manager == 'apt':
+        for log in ['/var/log/apt/history.log', '/var/log/dpkg.log']:
+            if os.path.exists(log):
+                log_files.append(log)
+
+    # DNF logs (Fedora)
+    elif package_manager == 'dnf':
+        if os.path.exists('/var/log/dnf.log'):
+            log_files.append('/var/log/dnf.log')
+        if os.path.exists('/var/log/dnf.rpm.log'):
+            log_files.append('/var/log/dnf.rpm.log')
+
+    # YUM logs (RHEL/CentOS)
+    elif package_manager == 'yum':
+        if os.path.exists('/var/log/yum.log'):
+            log_files.append('/var/log/yum.log')
+
+    # Pacman logs (Arch)
+    elif package_manager == 'pacman':
+        if os.path.exists('/var/log/pacman.log'):
+            log_files.append('/var/log/pacman.log')
+
+    # Zypper logs (openSUSE)
+    elif package_manager == 'zypper':
+        if os.path.exists('/var/log/zypper.log'):
+            log_files.append('/var/log/zypper.log')
+
+    # A tuple, so callers can't change the cached value
+    return tuple(log_files)
+
+
+class SoftwareEvent(Event):
+    """
+    A single software change event.
+
+    The message and "data" dict are only built when they are actually
+    read, so a caller that just counts events never pays for them.
+    """
+
+    __slots__ = ('package_name', 'action', 'version', 'package_manager')
+
+    def __init__(
+        self,
+        event_type: str,
+        severity: str,
+        source: str,
+        host: str,
+        host_ipv4: str,
+        timestamp: datetime,
+        package_name: str,
+        action: str,
+        version: str,
+        package_manager: str
+    ):
+        # Event.__init__ isn't called: it would assign message and data,
+        # which are computed here
+        self.category = "software"
+        self.event_type = event_type
+        self.severity = severity
+        self.source = source
+        self.os = "linux"
+        self.host = host
+        self.host_ipv4 = host_ipv4
+        self.timestamp = timestamp
+        self.package_name = package_name
+        self.action = action
+        self.version = version
+        self.package_manager = package_manager
+
+    @property
+    def message(self) -> str:
+        return f"Package {self.package_name} {self.action}: {self.version}"
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        return {
+            "package_name": self.package_name,
+            "action": self.action,
+            "version": self.version,
+            "package_manager": self.package_manager
+        }
 
 
 class LinuxSoftwareCollector:
@@ -45,178 +263,247 @@ class LinuxSoftwareCollector:
         self.host_ip = get_local_ip()
 
         # Detect package manager and log files
-        self.package_manager = self._detect_package_manager()
-        self.log_files = self._get_log_files()
-
-    def _detect_package_manager(self) -> str:
-        """Detect which package manager is used on this system."""
-        # Check for existence of package manager commands
-        if os.path.exists('/usr/bin/apt') or os.path.exists('/usr/bin/dpkg'):
-            return 'apt'
-        elif os.path.exists('/usr/bin/dnf'):
-            return 'dnf'
-        elif os.path.exists('/usr/bin/yum'):
-            return 'yum'
-        elif os.path.exists('/usr/bin/pacman'):
-            return 'pacman'
-        elif os.path.exists('/usr/bin/zypper'):
-            return 'zypper'
-        return 'unknown'
-
-    def _get_log_files(self) -> List[str]:
-        """Get list of package manager log files to check."""
-        log_files = []
-
-        # APT/DPKG logs (Ubuntu/Debian)
-        if self.package_manager == 'apt':
-            for log in ['/var/log/apt/history.log', '/var/log/dpkg.log']:
-                if os.path.exists(log):
-                    log_files.append(log)
-
-        # DNF logs (Fedora)
-        elif self.package_manager == 'dnf':
-            if os.path.exists('/var/log/dnf.log'):
-                log_files.append('/var/log/dnf.log')
-            if os.path.exists('/var/log/dnf.rpm.log'):
-                log_files.append('/var/log/dnf.rpm.log')
-
-        # YUM logs (RHEL/CentOS)
-        elif self.package_manager == 'yum':
-            if os.path.exists('/var/log/yum.log'):
-                log_files.append('/var/log/yum.log')
-
-        # Pacman logs (Arch)
-        elif self.package_manager == 'pacman':
-            if os.path.exists('/var/log/pacman.log'):
-                log_files.append('/var/log/pacman.log')
-
-        # Zypper logs (openSUSE)
-        elif self.package_manager == 'zypper':
-            if os.path.exists('/var/log/zypper.log'):
-                log_files.append('/var/log/zypper.log')
-
-        return log_files
-
-    def collect_events(self, max_lines: int = 1000) -> List[Dict[str, Any]]:
+        self.package_manager = _detect_package_manager()
+        self.log_files = list(_get_log_files(self.package_manager))
+
+        # yum/dnf timestamps don't include the year; refreshed on every
+        # collect_events() call rather than looked up for every line
+        self.year = datetime.utcnow().year
+
+        # (parser or file, exception type) -> when that error was last logged
+        self._err_cache: Dict[Tuple[str, str], float] = {}
+
+        # log file -> where the previous collection stopped reading it (as
+        # returned by read_tail_lines()). The next collection only reads
+        # lines appended after it.
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+
+    def collect_events(self, max_lines: int = 1000) -> List[SoftwareEvent]:
         """
         Collect software change events.
 
+        The first call reads the most recent lines of each log. Later calls
+        on the same collector only read lines appended since the previous
+        call (starting over if a log was rotated or truncated).
+
+        When there are several logs (apt and dnf each keep two), they are
+        read and parsed in parallel threads, so one file's reads overlap
+        the other's.
+
         Args:
             max_lines: Maximum lines to process per log file
 
         Returns:
-            list: List of event dictionaries
+            list: List of SoftwareEvent objects (call to_dict() for the
+                Loglumen JSON format)
         """
+        self.year = datetime.utcnow().year
+        log_files = self._readable_log_files()
+
+        if len(log_files) <= 1:
+            return [
+                event
+                for log_file in log_files
+                for event in self._iter_from_file(log_file, max_lines)
+            ]
+
         events = []
+        with ThreadPoolExecutor(max_workers=len(log_files)) as executor:
+            # map() keeps the files' order
+            for file_events in executor.map(
+                lambda log_file: list(self._iter_from_file(log_file, max_lines)),
+                log_files
+            ):
+                events.extend(file_events)
+
+        return events
+
+    def iter_events(self, max_lines: int = 1000) -> Iterator[SoftwareEvent]:
+        """
+        Yield software change events as they are parsed.
+
+        Same as collect_events(), but events are handed over one at a time
+        instead of being gathered into a list first, so a consumer that
+        forwards them as they come never holds every event in memory.
+        Files are read one after the other.
+
+        Args:
+            max_lines: Maximum lines to process per log file
+
+        Yields:
+            SoftwareEvent: Events, file by file in log order
+
+        Example:
+            collector = LinuxSoftwareCollector()
+            for event in collector.iter_events():
+                print(event['message'])
+        """
+        self.year = datetime.utcnow().year
+
+        for log_file in self._readable_log_files():
+            yield from self._iter_from_file(log_file, max_lines)
 
+    def _readable_log_files(self) -> List[str]:
+        """Get the log files this process can read, reporting the rest."""
         if not self.log_files:
-            print(f"No package manager logs found (detected: {self.package_manager})")
-            return events
+            logger.warning("No package manager logs found (detected: %s)", self.package_manager)
+            return []
 
+        readable = []
         for log_file in self.log_files:
             if os.access(log_file, os.R_OK):
-                file_events = self._collect_from_file(log_file, max_lines)
-                events.extend(file_events)
+                readable.append(log_file)
             else:
-                print(f"Warning: No permission to read {log_file}")
+                logger.warning("No permission to read %s", log_file)
 
-        return events
+        return readable
 
-    def _collect_from_file(self, log_file: str, max_lines: int) -> List[Dict[str, Any]]:
-        """Collect events from a specific log file."""
-        events = []
+    def _iter_from_file(self, log_file: str, max_lines: int) -> Iterator[SoftwareEvent]:
+        """Yield events from a specific log file."""
+        # The log file decides the parser, so pick it once for the whole file
+        parser = self._select_parser(log_file)
+        if parser is None:
+            return
 
         try:
-            with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-                recent_lines = lines[-max_lines:] if len(lines) > max_lines else lines
+            # Only read what was appended since the last collection (all of
+            # the last max_lines lines the first time, or after rotation)
+            data, offset = read_tail_lines(
+                log_file, max_lines, self._offsets.get(log_file)
+            )
+            lines = data.split(b'\n')
+            lines.pop()  # Empty string after the final newline
+
+            for line in lines:
+                # Lines come without their "\n", so a blank line is empty;
+                # whitespace-only lines fail every parser's first check
+                if not line:
+                    continue
+                event = parser(line)
+                if event:
+                    yield event
 
-                for line in recent_lines:
-                    event = self._parse_log_line(line, log_file)
-                    if event:
-                        events.append(event)
+            # Only move past these lines once they have all been parsed
+            self._offsets[log_file] = offset
 
         except Exception as e:
-            print(f"Error reading {log_file}: {e}")
+            self._warn_once((log_file, type(e).__name__), f"Error reading {log_file}: {e}")
+
+    def _make_event(
+        self,
+        event_type: str,
+        severity: str,
+        package_manager: str,
+        timestamp: datetime,
+        package: str,
+        action: str,
+        version: str
+    ) -> SoftwareEvent:
+        """
+        Build an event for this collector.
 
-        return events
+        The fields that never change for this collector (host, IP) are
+        filled in from values cached on the instance, and the package
+        manager doubles as the event source.
 
-    def _parse_log_line(self, line: str, log_file: str) -> Optional[Dict[str, Any]]:
-        """Parse a log line based on package manager type."""
-        if not line.strip():
-            return None
+        Returns:
+            SoftwareEvent: The event
+        """
+        return SoftwareEvent(
+            event_type,
+            severity,
+            package_manager,
+            self.hostname,
+            self.host_ip,
+            timestamp,
+            package,
+            action,
+            version,
+            package_manager
+        )
+
+    def _warn_once(self, key: Tuple[str, str], msg: str) -> None:
+        """
+        Log a warning, unless one with the same key was logged in the last
+        ERROR_REPEAT_INTERVAL seconds.
 
-        # Determine parser based on file name
+        Args:
+            key: What the error is about, e.g. ("dpkg", "ValueError")
+            msg: Warning message
+        """
+        now = time.monotonic()
+        last = self._err_cache.get(key)
+        if last is not None and now - last < ERROR_REPEAT_INTERVAL:
+            return
+
+        self._err_cache[key] = now
+        logger.warning(msg)
+
+    def _select_parser(self, log_file: str) -> Optional[Callable[[bytes], Optional[SoftwareEvent]]]:
+        """Pick the line parser for a log file based on its name."""
         if 'dpkg.log' in log_file:
-            return self._parse_dpkg_line(line)
+            return self._parse_dpkg_line
         elif 'apt/history.log' in log_file:
-            return self._parse_apt_history_line(line)
+            return self._parse_apt_history_line
         elif 'yum.log' in log_file or 'dnf.log' in log_file or 'dnf.rpm.log' in log_file:
-            return self._parse_yum_dnf_line(line)
+            return self._parse_yum_dnf_line
         elif 'pacman.log' in log_file:
-            return self._parse_pacman_line(line)
+            return self._parse_pacman_line
         elif 'zypper.log' in log_file:
-            return self._parse_zypper_line(line)
+            return self._parse_zypper_line
 
         return None
 
-    def _parse_dpkg_line(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_dpkg_line(self, line: bytes) -> Optional[SoftwareEvent]:
         """
         Parse dpkg.log line.
 
         Format: 2025-11-16 10:30:00 install nginx:amd64 <none> 1.18.0-1ubuntu1
         """
         try:
-            # Parse timestamp (first two fields)
-            parts = line.split()
+            # Parse timestamp (first two fields). Only fields 0-5 are used,
+            # so stop splitting after the sixth; anything past it stays
+            # unsplit in parts[6]
+            parts = line.split(None, 6)
             if len(parts) < 5:
                 return None
 
-            timestamp_str = f"{parts[0]} {parts[1]}"
-            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-
-            action = parts[2]  # install, upgrade, remove, purge
-            package = parts[3].split(':')[0]  # Remove architecture suffix
-
-            # Determine event type and severity
-            if action == 'install':
-                event_type = 'software_installed'
-                severity = 'info'
-            elif action in ['upgrade', 'update']:
-                event_type = 'software_updated'
-                severity = 'info'
-            elif action in ['remove', 'purge']:
-                event_type = 'software_removed'
-                severity = 'info'
-            else:
+            # Most dpkg lines are status/configure/trigproc lines, so check
+            # the action before doing any timestamp work
+            mapping = _DPKG_ACTION_MAP.get(parts[2])
+            if mapping is None:
                 return None  # Skip configure, trigproc, etc.
+            event_type, severity = mapping
+            action = parts[2].decode()  # install, upgrade, remove, purge
+
+            # Fixed layout "2025-11-16 10:30:00": slice the fields out
+            # directly, strptime only for anything that doesn't fit
+            date_str, time_str = parts[0], parts[1]
+            try:
+                timestamp = datetime(
+                    int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                    int(time_str[0:2]), int(time_str[3:5]), int(time_str[6:8])
+                )
+            except ValueError:
+                timestamp = datetime.strptime(
+                    f"{date_str.decode('utf-8', 'ignore')} {time_str.decode('utf-8', 'ignore')}",
+                    "%Y-%m-%d %H:%M:%S"
+                )
+
+            package = parts[3].split(b':')[0].decode('utf-8', 'ignore')  # Remove architecture suffix
 
             # Extract version if available
-            version = parts[5] if len(parts) > 5 else "unknown"
-
-            return create_event(
-                category="software",
-                event_type=event_type,
-                severity=severity,
-                message=f"Package {package} {action}: {version}",
-                source="dpkg",
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
-                timestamp=timestamp,
-                data={
-                    "package_name": package,
-                    "action": action,
-                    "version": version,
-                    "package_manager": "dpkg"
-                }
+            version = parts[5].decode('utf-8', 'ignore') if len(parts) > 5 else "unknown"
+
+            return self._make_event(
+                event_type, severity, "dpkg", timestamp, package, action, version
             )
 
         except Exception as e:
-            print(f"Error parsing dpkg line: {e}")
+            self._warn_once(('dpkg', type(e).__name__), f"Error parsing dpkg line: {e}")
             return None
 
-    def _parse_apt_history_line(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_apt_history_line(self, line: bytes) -> Optional[SoftwareEvent]:
         """
         Parse apt history.log line.
 
@@ -228,180 +515,138 @@ class LinuxSoftwareCollector:
         # This file has multi-line entries, so we parse key-value pairs
         # For simplicity, we'll extract Install/Upgrade/Remove lines
 
-        if line.startswith('Install:'):
-            action = 'install'
-            event_type = 'software_installed'
-        elif line.startswith('Upgrade:'):
-            action = 'upgrade'
-            event_type = 'software_updated'
-        elif line.startswith('Remove:'):
-            action = 'remove'
-            event_type = 'software_removed'
-        else:
+        # Most lines are Start-Date/Commandline/End-Date, skip them before
+        # splitting anything
+        if not line.startswith(_APT_ACTION_PREFIXES):
             return None
 
+        prefix, _, packages_str = line.partition(b':')
+        action, event_type = _APT_ACTION_MAP[prefix]
+
         try:
             # Extract package info
             # Format: "Install: nginx:amd64 (1.18.0-1ubuntu1), ..."
-            packages_str = line.split(':', 1)[1].strip()
+            packages_str = packages_str.strip()
 
             # Just parse first package for simplicity
-            pkg_match = re.search(r'([a-zA-Z0-9\-\.\_]+)(?:\:[\w]+)?\s*\(([^\)]+)\)', packages_str)
+            pkg_match = _APT_PKG_RE.search(packages_str)
             if not pkg_match:
                 return None
 
-            package = pkg_match.group(1)
-            version = pkg_match.group(2)
-
-            return create_event(
-                category="software",
-                event_type=event_type,
-                severity="info",
-                message=f"Package {package} {action}: {version}",
-                source="apt",
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
-                timestamp=datetime.utcnow(),  # APT history doesn't have inline timestamps
-                data={
-                    "package_name": package,
-                    "action": action,
-                    "version": version,
-                    "package_manager": "apt"
-                }
+            package = pkg_match.group(1).decode()
+            version = pkg_match.group(2).decode('utf-8', 'ignore')
+
+            # APT history doesn't have inline timestamps
+            return self._make_event(
+                event_type, "info", "apt", datetime.utcnow(), package, action, version
             )
 
         except Exception as e:
-            print(f"Error parsing apt line: {e}")
+            self._warn_once(('apt', type(e).__name__), f"Error parsing apt line: {e}")
             return None
 
-    def _parse_yum_dnf_line(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_yum_dnf_line(self, line: bytes) -> Optional[SoftwareEvent]:
         """
         Parse yum.log or dnf.log line.
 
         Format: Nov 16 10:30:00 Installed: nginx-1.18.0-1.el8.x86_64
         """
         try:
-            # Extract action
-            if 'Installed:' in line:
-                action = 'install'
-                event_type = 'software_installed'
-            elif 'Updated:' in line or 'Upgrade:' in line:
-                action = 'update'
-                event_type = 'software_updated'
-            elif 'Erased:' in line or 'Removed:' in line:
-                action = 'remove'
-                event_type = 'software_removed'
-            else:
-                return None
-
-            # Parse timestamp (first 15 chars for syslog format)
-            timestamp_str = line[:15]
-            year = datetime.utcnow().year
-            timestamp = datetime.strptime(f"{year} {timestamp_str}", "%Y %b %d %H:%M:%S")
-
-            # Extract package name and version
+            # Extract action, package name and version
             # Format: "Installed: nginx-1.18.0-1.el8.x86_64"
-            pkg_match = re.search(r'(Installed|Updated|Erased|Removed):\s+([^\s]+)', line)
+            pkg_match = _YUM_PKG_RE.search(line)
             if not pkg_match:
                 return None
 
-            full_package = pkg_match.group(2)
+            action, event_type = _YUM_ACTION_MAP[pkg_match.group(1)]
+
+            # Parse timestamp (first 15 chars for syslog format). The layout
+            # is fixed ("Nov 16 10:30:00"), so slice the fields out directly,
+            # strptime only for anything that doesn't fit
+            try:
+                timestamp = datetime(
+                    self.year,
+                    _MONTHS[line[0:3]],
+                    int(line[4:6]),
+                    int(line[7:9]),
+                    int(line[10:12]),
+                    int(line[13:15])
+                )
+            except (KeyError, ValueError):
+                timestamp = datetime.strptime(
+                    f"{self.year} {line[:15].decode('utf-8', 'ignore')}", "%Y %b %d %H:%M:%S"
+                )
 
             # Split package name and version
             # Format: package-version-release.arch
-            pkg_parts = full_package.rsplit('.', 1)[0]  # Remove arch
-            name_version = pkg_parts.rsplit('-', 2)  # Split name from version-release
-
-            package = name_version[0] if name_version else full_package
-            version = '-'.join(name_version[1:]) if len(name_version) > 1 else "unknown"
-
-            return create_event(
-                category="software",
-                event_type=event_type,
-                severity="info",
-                message=f"Package {package} {action}: {version}",
-                source="yum/dnf",
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
-                timestamp=timestamp,
-                data={
-                    "package_name": package,
-                    "action": action,
-                    "version": version,
-                    "package_manager": "yum/dnf"
-                }
+            full_package = pkg_match.group(2)
+            nvr_match = _YUM_NVR_RE.match(full_package)
+            if nvr_match:
+                package = nvr_match.group(1).decode('utf-8', 'ignore')
+                version = nvr_match.group(2).decode('utf-8', 'ignore')
+            else:
+                # No release part (e.g. "bar-1.0.x86_64")
+                name_version = full_package.decode('utf-8', 'ignore').rsplit('.', 1)[0].rsplit('-', 2)
+                package = name_version[0]
+                version = '-'.join(name_version[1:]) if len(name_version) > 1 else "unknown"
+
+            return self._make_event(
+                event_type, "info", "yum/dnf", timestamp, package, action, version
             )
 
         except Exception as e:
-            print(f"Error parsing yum/dnf line: {e}")
+            self._warn_once(('yum/dnf', type(e).__name__), f"Error parsing yum/dnf line: {e}")
             return None
 
-    def _parse_pacman_line(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_pacman_line(self, line: bytes) -> Optional[SoftwareEvent]:
         """
         Parse pacman.log line.
 
         Format: [2025-11-16T10:30:00+0000] [ALPM] installed nginx (1.18.0-1)
         """
+        # Cheap substring test first: most pacman lines are transaction,
+        # hook and scriptlet output that can't match the package pattern
+        if b'installed' not in line and b'upgraded' not in line and b'removed' not in line:
+            return None
+
         try:
-            # Extract timestamp
-            timestamp_match = re.search(r'\[([\d\-T\+:]+)\]', line)
-            if not timestamp_match:
+            # Extract timestamp: every pacman line starts with it in brackets
+            end = line.find(b']')
+            if not line.startswith(b'[') or end < 0:
                 return None
 
-            timestamp_str = timestamp_match.group(1)
-            timestamp = datetime.fromisoformat(timestamp_str.replace('+0000', ''))
-
-            # Determine action
-            if 'installed' in line.lower():
-                action = 'install'
-                event_type = 'software_installed'
-            elif 'upgraded' in line.lower():
-                action = 'upgrade'
-                event_type = 'software_updated'
-            elif 'removed' in line.lower():
-                action = 'remove'
-                event_type = 'software_removed'
-            else:
+            timestamp = _pacman_timestamp(line[1:end])
+
+            # Extract action, package name and version; the rest of the
+            # line is space-delimited
+            # Format: "[ALPM] installed nginx (1.18.0-1)"
+            parts = line[end + 1:].split(None, 3)
+            if len(parts) < 4:
                 return None
 
-            # Extract package name and version
-            # Format: "installed nginx (1.18.0-1)"
-            pkg_match = re.search(r'(?:installed|upgraded|removed)\s+([^\s]+)\s+\(([^\)]+)\)', line)
-            if not pkg_match:
+            mapping = _PACMAN_ACTION_MAP.get(parts[1])
+            version_part = parts[3]
+            close = version_part.find(b')')
+            if mapping is None or not version_part.startswith(b'(') or close < 2:
                 return None
 
-            package = pkg_match.group(1)
-            version = pkg_match.group(2)
-
-            return create_event(
-                category="software",
-                event_type=event_type,
-                severity="info",
-                message=f"Package {package} {action}: {version}",
-                source="pacman",
-                os="linux",
-                hostname=self.hostname,
-                host_ip=self.host_ip,
-                timestamp=timestamp,
-                data={
-                    "package_name": package,
-                    "action": action,
-                    "version": version,
-                    "package_manager": "pacman"
-                }
+            action, event_type = mapping
+            package = parts[2].decode('utf-8', 'ignore')
+            version = version_part[1:close].decode('utf-8', 'ignore')
+
+            return self._make_event(
+                event_type, "info", "pacman", timestamp, package, action, version
             )
 
         except Exception as e:
-            print(f"Error parsing pacman line: {e}")
+            self._warn_once(('pacman', type(e).__name__), f"Error parsing pacman line: {e}")
             return None
 
-    def _parse_zypper_line(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_zypper_line(self, line: bytes) -> Optional[SoftwareEvent]:
         """Parse zypper.log line (openSUSE)."""
         # Zypper log format varies, implement basic parsing
         try:
-            if 'installed' in line.lower() or 'removed' in line.lower() or 'updated' in line.lower():
+            if b'installed' in line.lower() or b'removed' in line.lower() or b'updated' in line.lower():
                 # Basic parsing - you can enhance this
                 return None  # Placeholder for now
         except Exception:
@@ -409,27 +654,42 @@ class LinuxSoftwareCollector:
         return None
 
 
-def collect_software_events(max_lines: int = 1000) -> List[Dict[str, Any]]:
+@lru_cache(maxsize=1)
+def _get_collector() -> LinuxSoftwareCollector:
+    """
+    The collector used by collect_software_events().
+
+    Kept for the life of the process so its read offsets carry over from
+    one collection to the next.
+    """
+    return LinuxSoftwareCollector()
+
+
+def collect_software_events(max_lines: int = 1000) -> List[SoftwareEvent]:
     """
     Convenience function to collect software change events.
 
+    The first call reads the most recent lines of each log; later calls
+    only return events from lines appended since the previous call.
+
     Args:
         max_lines: Maximum lines to process per log file
 
     Returns:
-        list: List of event dictionaries
+        list: List of SoftwareEvent objects (call to_dict() for the
+            Loglumen JSON format)
 
     Example:
         events = collect_software_events()
         print(f"Found {len(events)} software changes")
     """
-    collector = LinuxSoftwareCollector()
-    return collector.collect_events(max_lines)
+    return _get_collector().collect_events(max_lines)
 
 
 if __name__ == "__main__":
     """Test the software collector."""
     import json
+    from collections import Counter
 
     print("=" * 70)
     print("Software Changes Event Collector - Test Mode")
@@ -448,27 +708,21 @@ if __name__ == "__main__":
         print("Sample events:")
         for i, event in enumerate(events[:3], 1):
             print(f"\nEvent {i}:")
-            print(json.dumps(event, indent=2))
+            print(json.dumps(event.to_dict(), indent=2))
 
         # Summary
         print("\n" + "=" * 70)
         print("Summary by event type:")
-        event_types = {}
-        for event in events:
-            et = event['event_type']
-            event_types[et] = event_types.get(et, 0) + 1
+        event_types = Counter(event.event_type for event in events)
 
         for et, count in sorted(event_types.items()):
             print(f"  {et}: {count}")
 
         # Most common packages
         print("\nMost frequently changed packages:")
-        packages = {}
-        for event in events:
-            pkg = event.get('data', {}).get('package_name', 'unknown')
-            packages[pkg] = packages.get(pkg, 0) + 1
+        packages = Counter(event.package_name for event in events)
 
-        for pkg, count in sorted(packages.items(), key=lambda x: x[1], reverse=True)[:10]:
+        for pkg, count in packages.most_common(10):
             print(f"  {pkg}: {count} changes")
 
     else:
@@ -12,21 +12,53 @@ Collects critical system events:
 Log locations:
 - /var/log/kern.log (Ubuntu/Debian)
 - /var/log/messages (RHEL/CentOS)
-- journalctl -k (systemd kernel logs)
+- journald kernel messages (read through libsystemd, or journalctl -k)
 
 Author: Loglumen Team
 """
 
+import logging
 import os
 import re
 import subprocess
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, List, Dict, Optional, Tuple
 
 # Import utilities
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import create_event, get_hostname, get_local_ip, parse_syslog_timestamp
+try:
+    from ..utils import (
+        EPOCH, Event, get_hostname, get_local_ip, parse_syslog_timestamp, read_tail_lines
+    )
+except ImportError:
+    # Not imported as part of the collectors package (e.g. imported as
+    # linux.system by main.py, or run directly as a script)
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from utils import (
+        EPOCH, Event, get_hostname, get_local_ip, parse_syslog_timestamp, read_tail_lines
+    )
+
+# Try to import Google's RE2 bindings (pip install google-re2)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    from .journal_native import LIBSYSTEMD_AVAILABLE, read_journal
+except ImportError:
+    # Not imported as part of the linux package (e.g. run directly as a
+    # script)
+    from journal_native import LIBSYSTEMD_AVAILABLE, read_journal
+
+logger = logging.getLogger(__name__)
+
+# Seconds for which a repeat of the same kind of error is not logged
+# again (see _warn_once())
+ERROR_REPEAT_INTERVAL = 60
 
 
 # Log file locations
@@ -36,6 +68,95 @@ SYSTEM_LOG_LOCATIONS = [
     "/var/log/syslog",       # General system log
 ]
 
+# Journal fields read for each kernel message (libsystemd path)
+JOURNAL_FIELDS = ['MESSAGE', '_HOSTNAME']
+
+# Event patterns, compiled once at import instead of on every log line
+# kernel panic: "Kernel panic - not syncing: VFS: Unable to mount root fs"
+_PANIC_RE = re.compile(r'[Pp]anic[:\-]\s*(.+?)(?:\s*$|CPU:)')
+# OOM kill: "Killed process 12345 (nginx) total-vm:1234kB"; pid, process
+# and memory in one search, with single-field patterns for other reports
+_OOM_RE = re.compile(
+    r'Killed process (?P<pid>\d+) \((?P<proc>[^)]+)\)(?:.*?total-vm:(?P<vm>\d+)kB)?'
+)
+_OOM_PID_RE = re.compile(r'Killed process (\d+)')
+_OOM_VM_RE = re.compile(r'total-vm:(\d+)kB')
+# segfault: "program[12345]: segfault at 7f1234567890"; program, pid and
+# address in one search, with single-field patterns for other reports
+_SEGFAULT_RE = re.compile(r'\s([a-zA-Z0-9_\-\.]+)\[(\d+)\].*?segfault at ([0-9a-fA-F]+)')
+_SEGFAULT_PROG_RE = re.compile(r'\s([a-zA-Z0-9_\-\.]+)\[\d+\].*segfault')
+_SEG_PID_RE = re.compile(r'\[(\d+)\]')
+_SEG_ADDR_RE = re.compile(r'segfault at ([0-9a-fA-F]+)')
+# hardware error: "mce: CPU0: Machine Check Exception"
+_CPU_RE = re.compile(r'CPU(\d+)')
+# journald short-iso timestamp: "2025-11-16T10:30:00+0000"
+_ISO_TS_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T')
+
+# Event keyword (lowercase) -> (priority, parser method, another word the
+# line must also have). A line with keywords of several events goes to
+# the one with the lowest priority number.
+_EVENT_PARSERS = {
+    'kernel panic': (0, '_parse_kernel_panic', None),
+    'panic:': (0, '_parse_kernel_panic', None),
+    'oom': (1, '_parse_oom_kill', 'kill'),
+    'segfault': (2, '_parse_segfault', None),
+    'segmentation fault': (2, '_parse_segfault', None),
+    'hardware error': (3, '_parse_hardware_error', None),
+    'mce:': (3, '_parse_hardware_error', None),
+    'oops:': (4, '_parse_kernel_oops', None),
+    'bug:': (4, '_parse_kernel_oops', None),
+    'reboot': (5, '_parse_unexpected_reboot', 'unexpected'),
+}
+
+# Any event keyword. Case-sensitive, as it only runs on lowercased text.
+# The bytes version finds the event lines in a whole block of raw log
+# data in one scan, with RE2's non-backtracking matcher when it is
+# installed, so lines without a keyword are never split out or decoded.
+_KEYWORD_RE = re.compile('|'.join(map(re.escape, _EVENT_PARSERS)))
+_KEYWORD_BLOCK_RE = (re2 if RE2_AVAILABLE else re).compile(_KEYWORD_RE.pattern.encode())
+
+
+def _tail_block(data: bytes, n: int) -> bytes:
+    """
+    Cut log data from read_tail_lines() down to its last n lines.
+
+    Args:
+        data: Log data, starting at a line start
+        n: Number of lines to keep
+
+    Returns:
+        bytes: The last n lines, split the way a text-mode file splits
+               them (universal newlines: "\\r\\n" and "\\r" end a line
+               too, and become "\\n")
+    """
+    if b'\r' in data:
+        # Decoded first, like a text-mode file: bytes dropped as invalid
+        # UTF-8 between a CR and an LF leave a single CRLF
+        text = data.decode('utf-8', 'ignore')
+        data = text.replace('\r\n', '\n').replace('\r', '\n').encode('utf-8')
+
+    count = data.count(b'\n')
+    if data and not data.endswith(b'\n'):
+        count += 1  # Last line still being written
+    if count > n:
+        data = data.split(b'\n', count - n)[-1]
+    return data
+
+
+@lru_cache(maxsize=1)
+def _current_boot_id() -> Optional[str]:
+    """
+    Get the ID of the running boot, as the journal's _BOOT_ID field has it.
+
+    Returns:
+        str: Boot ID (32 hex digits), or None if it can't be read
+    """
+    try:
+        with open('/proc/sys/kernel/random/boot_id') as f:
+            return f.read().strip().replace('-', '')
+    except OSError:
+        return None
+
 
 class LinuxSystemCollector:
     """
@@ -58,6 +179,9 @@ class LinuxSystemCollector:
         else:
             self.log_file = self._find_system_log()
 
+        # (parser or source, exception type) -> when that error was last logged
+        self._err_cache: Dict[Tuple[str, str], float] = {}
+
     def _find_system_log(self) -> Optional[str]:
         """Find the system/kernel log file."""
         for log_path in SYSTEM_LOG_LOCATIONS:
@@ -65,7 +189,7 @@ class LinuxSystemCollector:
                 return log_path
         return None
 
-    def collect_events(self, max_lines: int = 1000, use_journald: bool = True) -> List[Dict[str, Any]]:
+    def collect_events(self, max_lines: int = 1000, use_journald: bool = True) -> List[Event]:
         """
         Collect system crash events.
 
@@ -74,47 +198,71 @@ class LinuxSystemCollector:
             use_journald: If True and log file unavailable, try journald
 
         Returns:
-            list: List of event dictionaries
+            list: List of Event objects
         """
         events = []
 
         # Try log file first
-        if self.log_file and os.path.exists(self.log_file):
-            if os.access(self.log_file, os.R_OK):
-                events = self._collect_from_file(max_lines)
-            else:
-                print(f"Warning: No permission to read {self.log_file}")
+        if self.log_file:
+            events = self._collect_from_file(max_lines)
 
-        # Try journald if no log file or no events
+        # Try journald if no log file or no events. Only queried when it is
+        # needed: most systems have a log file, and journald is the slow part.
         if use_journald and (not self.log_file or len(events) == 0):
             journald_events = self._collect_from_journald(max_lines)
             events.extend(journald_events)
 
         return events
 
-    def _collect_from_file(self, max_lines: int) -> List[Dict[str, Any]]:
-        """Collect events from log file."""
+    def _collect_from_file(self, max_lines: int) -> List[Event]:
+        """
+        Collect events from log file.
+
+        The file is simply opened: a missing or unreadable file shows up
+        as the open failing, so there are no stat() and access() calls
+        ahead of every read.
+        """
         events = []
 
         try:
-            with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-                recent_lines = lines[-max_lines:] if len(lines) > max_lines else lines
-
-                for line in recent_lines:
-                    event = self._parse_log_line(line)
-                    if event:
-                        events.append(event)
+            data, _ = read_tail_lines(self.log_file, max_lines, include_partial=True)
+            events = self._parse_block(_tail_block(data, max_lines), keepends=True)
 
+        except FileNotFoundError:
+            pass  # Rotated away or never there; journald is tried instead
+        except PermissionError:
+            logger.warning("No permission to read %s", self.log_file)
         except Exception as e:
-            print(f"Error reading {self.log_file}: {e}")
+            self._warn_once((self.log_file, type(e).__name__), f"Error reading {self.log_file}: {e}")
 
         return events
 
-    def _collect_from_journald(self, max_lines: int) -> List[Dict[str, Any]]:
+    def _collect_from_journald(self, max_lines: int) -> List[Event]:
         """Collect events from journald kernel log."""
         events = []
 
+        # Read the kernel log in-process through libsystemd when we can: no
+        # journalctl process to start, and each message comes with its
+        # timestamp instead of it being parsed back out of the text.
+        # The matches are what "journalctl -k" uses (kernel messages from
+        # the current boot), so the journal's indexes do the filtering.
+        if LIBSYSTEMD_AVAILABLE:
+            matches = ['_TRANSPORT=kernel']
+            boot_id = _current_boot_id()
+            if boot_id:
+                matches.append(f'_BOOT_ID={boot_id}')
+
+            try:
+                entries = read_journal(matches, max_entries=max_lines, fields=JOURNAL_FIELDS)
+            except OSError:
+                pass  # Fall back to journalctl
+            else:
+                for entry in entries:
+                    event = self._parse_journal_entry(entry)
+                    if event:
+                        events.append(event)
+                return events
+
         try:
             # Query kernel messages
             cmd = [
@@ -125,60 +273,134 @@ class LinuxSystemCollector:
                 '-o', 'short-iso'
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
 
             if result.returncode == 0 and result.stdout:
-                for line in result.stdout.split('\n'):
-                    event = self._parse_log_line(line)
-                    if event:
-                        events.append(event)
+                events = self._parse_block(result.stdout, keepends=False)
 
         except Exception as e:
-            print(f"Error querying journald: {e}")
+            self._warn_once(('journald', type(e).__name__), f"Error querying journald: {e}")
 
         return events
 
-    def _parse_log_line(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_block(self, data: bytes, keepends: bool) -> List[Event]:
+        """
+        Parse a block of raw log lines for system events.
+
+        The block is lowercased once and searched for the event keywords
+        in one scan. Only the lines a keyword was found in are cut out of
+        the block, decoded and parsed.
+
+        Args:
+            data: Raw log lines
+            keepends: Pass lines to the parsers with their "\\n"
+
+        Returns:
+            list: List of Event objects
+        """
+        events = []
+        lowered = data.lower()
+
+        # Hot loop: bind lookups to locals once
+        find = lowered.find
+        rfind = lowered.rfind
+        select = self._select_parser
+        append = events.append
+
+        end = 0  # Where the line after the last one looked at starts
+        for match in _KEYWORD_BLOCK_RE.finditer(lowered):
+            pos = match.start()
+            if pos < end:
+                continue  # Another keyword in a line already looked at
+
+            start = rfind(b'\n', 0, pos) + 1
+            end = find(b'\n', pos)
+            if end < 0:
+                end = len(lowered)
+
+            # Only ASCII letters were lowered, so the offsets are the same
+            # in the original block
+            parser = select(lowered[start:end].decode('utf-8', 'ignore'))
+            line = data[start:end + 1 if keepends else end]
+            end += 1
+            if parser is None:
+                continue
+
+            line = line.decode('utf-8', 'ignore')
+
+            # Skip journal hints
+            if line.startswith(('--', 'Hint:')):
+                continue
+
+            event = parser(line)
+            if event:
+                append(event)
+
+        return events
+
+    def _parse_journal_entry(self, entry: Dict[str, str]) -> Optional[Event]:
+        """
+        Parse a kernel journal entry (from read_journal) for system events.
+
+        Args:
+            entry: Journal entry (field name -> value)
+
+        Returns:
+            Event: Event or None
+        """
+        # The line journalctl would print, less the timestamp, which is
+        # taken from the entry as is
+        line = f"{entry.get('_HOSTNAME', self.hostname)} kernel: {entry.get('MESSAGE', '')}"
+        timestamp = EPOCH + timedelta(microseconds=int(entry['__REALTIME_TIMESTAMP']))
+        return self._parse_log_line(line, timestamp)
+
+    def _parse_log_line(self, line: str, timestamp: Optional[datetime] = None) -> Optional[Event]:
         """
         Parse a log line for system events.
 
         Args:
             line: Log line to parse
+            timestamp: Time of the line, if known (otherwise it is parsed
+                from the line)
 
         Returns:
-            dict: Event dictionary or None
+            Event: Event or None
         """
-        if not line.strip():
+        # Blank line (isspace() checks it without a stripped copy)
+        if not line or line.isspace():
             return None
 
         # Skip journal hints
-        if line.startswith('--') or line.startswith('Hint:'):
+        if line.startswith(('--', 'Hint:')):
             return None
 
-        line_lower = line.lower()
-
-        # Check for different event types
-        if 'kernel panic' in line_lower or 'panic:' in line_lower:
-            return self._parse_kernel_panic(line)
-
-        elif 'oom' in line_lower and 'kill' in line_lower:
-            return self._parse_oom_kill(line)
-
-        elif 'segfault' in line_lower or 'segmentation fault' in line_lower:
-            return self._parse_segfault(line)
+        parser = self._select_parser(line.lower())
+        if parser is None:
+            return None
+        return parser(line, timestamp)
 
-        elif 'hardware error' in line_lower or 'mce:' in line_lower:
-            return self._parse_hardware_error(line)
+    def _select_parser(
+        self,
+        line_lower: str
+    ) -> Optional[Callable[..., Optional[Event]]]:
+        """
+        Pick the parser for a log line from the event keywords in it.
 
-        elif 'oops:' in line_lower or 'bug:' in line_lower:
-            return self._parse_kernel_oops(line)
+        Args:
+            line_lower: Log line, lowercased
 
-        elif 'reboot' in line_lower and 'unexpected' in line_lower:
-            return self._parse_unexpected_reboot(line)
+        Returns:
+            The _parse_* method for the line, or None if it isn't an event
+        """
+        best = None
+        for keyword in _KEYWORD_RE.findall(line_lower):
+            priority, parser, also = _EVENT_PARSERS[keyword]
+            if (best is None or priority < best[0]) and (also is None or also in line_lower):
+                best = (priority, parser)
 
-        return None
+        return getattr(self, best[1]) if best else None
 
-    def _parse_kernel_panic(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_kernel_panic(self, line: str, timestamp: Optional[datetime] = None) -> Optional[Event]:
         """
         Parse kernel panic.
 
@@ -186,13 +408,14 @@ class LinuxSystemCollector:
         Nov 16 03:22:15 hostname kernel: Kernel panic - not syncing: VFS: Unable to mount root fs
         """
         try:
-            timestamp = self._extract_timestamp(line)
+            if timestamp is None:
+                timestamp = self._extract_timestamp(line)
 
             # Extract panic message
-            panic_match = re.search(r'[Pp]anic[:\-]\s*(.+?)(?:\s*$|CPU:)', line)
+            panic_match = _PANIC_RE.search(line)
             panic_msg = panic_match.group(1).strip() if panic_match else line
 
-            return create_event(
+            return Event(
                 category="system",
                 event_type="kernel_panic",
                 severity="critical",
@@ -209,10 +432,10 @@ class LinuxSystemCollector:
             )
 
         except Exception as e:
-            print(f"Error parsing kernel panic: {e}")
+            self._warn_once(('kernel panic', type(e).__name__), f"Error parsing kernel panic: {e}")
             return None
 
-    def _parse_oom_kill(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_oom_kill(self, line: str, timestamp: Optional[datetime] = None) -> Optional[Event]:
         """
         Parse Out of Memory kill.
 
@@ -220,21 +443,28 @@ class LinuxSystemCollector:
         Nov 16 10:30:00 hostname kernel: Out of memory: Killed process 12345 (nginx) total-vm:1234kB
         """
         try:
-            timestamp = self._extract_timestamp(line)
-
-            # Extract process name
-            process_match = re.search(r'Killed process \d+ \(([^)]+)\)', line)
-            process = process_match.group(1) if process_match else "unknown"
+            if timestamp is None:
+                timestamp = self._extract_timestamp(line)
+
+            # The kernel's report has all three fields
+            oom_match = _OOM_RE.search(line)
+            if oom_match:
+                pid, process, memory = oom_match.group('pid', 'proc', 'vm')
+                pid = int(pid)
+                memory = memory or "unknown"
+            else:
+                # Anything else gets whichever of them it has
+                process = "unknown"
 
-            # Extract PID
-            pid_match = re.search(r'Killed process (\d+)', line)
-            pid = int(pid_match.group(1)) if pid_match else None
+                # Extract PID
+                pid_match = _OOM_PID_RE.search(line)
+                pid = int(pid_match.group(1)) if pid_match else None
 
-            # Extract memory info
-            mem_match = re.search(r'total-vm:(\d+)kB', line)
-            memory = mem_match.group(1) if mem_match else "unknown"
+                # Extract memory info
+                mem_match = _OOM_VM_RE.search(line)
+                memory = mem_match.group(1) if mem_match else "unknown"
 
-            return create_event(
+            return Event(
                 category="system",
                 event_type="oom_kill",
                 severity="error",
@@ -253,10 +483,10 @@ class LinuxSystemCollector:
             )
 
         except Exception as e:
-            print(f"Error parsing OOM kill: {e}")
+            self._warn_once(('OOM kill', type(e).__name__), f"Error parsing OOM kill: {e}")
             return None
 
-    def _parse_segfault(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_segfault(self, line: str, timestamp: Optional[datetime] = None) -> Optional[Event]:
         """
         Parse segmentation fault.
 
@@ -264,21 +494,31 @@ class LinuxSystemCollector:
         Nov 16 12:00:00 hostname kernel: program[12345]: segfault at 7f1234567890 ip 00007f9876543210
         """
         try:
-            timestamp = self._extract_timestamp(line)
+            if timestamp is None:
+                timestamp = self._extract_timestamp(line)
+
+            # The kernel's report has all three fields
+            seg_match = _SEGFAULT_RE.search(line)
+            if seg_match:
+                program, pid, address = seg_match.groups()
+                pid = int(pid)
+            else:
+                # Anything else (e.g. a shell's "Segmentation fault") gets
+                # whichever of them it has
 
-            # Extract program name
-            prog_match = re.search(r'\s([a-zA-Z0-9_\-\.]+)\[\d+\].*segfault', line)
-            program = prog_match.group(1) if prog_match else "unknown"
+                # Extract program name
+                prog_match = _SEGFAULT_PROG_RE.search(line)
+                program = prog_match.group(1) if prog_match else "unknown"
 
-            # Extract PID
-            pid_match = re.search(r'\[(\d+)\]', line)
-            pid = int(pid_match.group(1)) if pid_match else None
+                # Extract PID
+                pid_match = _SEG_PID_RE.search(line)
+                pid = int(pid_match.group(1)) if pid_match else None
 
-            # Extract address
-            addr_match = re.search(r'segfault at ([0-9a-fA-F]+)', line)
-            address = addr_match.group(1) if addr_match else "unknown"
+                # Extract address
+                addr_match = _SEG_ADDR_RE.search(line)
+                address = addr_match.group(1) if addr_match else "unknown"
 
-            return create_event(
+            return Event(
                 category="system",
                 event_type="segmentation_fault",
                 severity="warning",
@@ -297,10 +537,10 @@ class LinuxSystemCollector:
             )
 
         except Exception as e:
-            print(f"Error parsing segfault: {e}")
+            self._warn_once(('segfault', type(e).__name__), f"Error parsing segfault: {e}")
             return None
 
-    def _parse_hardware_error(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_hardware_error(self, line: str, timestamp: Optional[datetime] = None) -> Optional[Event]:
         """
         Parse hardware error.
 
@@ -308,16 +548,17 @@ class LinuxSystemCollector:
         Nov 16 15:00:00 hostname kernel: mce: CPU0: Machine Check Exception: 4 Bank 5
         """
         try:
-            timestamp = self._extract_timestamp(line)
+            if timestamp is None:
+                timestamp = self._extract_timestamp(line)
 
             # Extract error details
             error_msg = line.split('kernel:')[-1].strip() if 'kernel:' in line else line
 
             # Extract CPU if present
-            cpu_match = re.search(r'CPU(\d+)', line)
+            cpu_match = _CPU_RE.search(line)
             cpu = cpu_match.group(1) if cpu_match else None
 
-            return create_event(
+            return Event(
                 category="system",
                 event_type="hardware_error",
                 severity="error",
@@ -335,10 +576,10 @@ class LinuxSystemCollector:
             )
 
         except Exception as e:
-            print(f"Error parsing hardware error: {e}")
+            self._warn_once(('hardware error', type(e).__name__), f"Error parsing hardware error: {e}")
             return None
 
-    def _parse_kernel_oops(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_kernel_oops(self, line: str, timestamp: Optional[datetime] = None) -> Optional[Event]:
         """
         Parse kernel oops (non-fatal kernel error).
 
@@ -346,7 +587,8 @@ class LinuxSystemCollector:
         Nov 16 16:00:00 hostname kernel: BUG: unable to handle kernel paging request
         """
         try:
-            timestamp = self._extract_timestamp(line)
+            if timestamp is None:
+                timestamp = self._extract_timestamp(line)
 
             # Extract oops/bug message
             msg = line.split('kernel:')[-1].strip() if 'kernel:' in line else line
@@ -354,7 +596,7 @@ class LinuxSystemCollector:
             # Determine if BUG or Oops
             error_type = "kernel_bug" if 'BUG:' in line else "kernel_oops"
 
-            return create_event(
+            return Event(
                 category="system",
                 event_type=error_type,
                 severity="error",
@@ -371,15 +613,16 @@ class LinuxSystemCollector:
             )
 
         except Exception as e:
-            print(f"Error parsing kernel oops: {e}")
+            self._warn_once(('kernel oops', type(e).__name__), f"Error parsing kernel oops: {e}")
             return None
 
-    def _parse_unexpected_reboot(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_unexpected_reboot(self, line: str, timestamp: Optional[datetime] = None) -> Optional[Event]:
         """Parse unexpected reboot event."""
         try:
-            timestamp = self._extract_timestamp(line)
+            if timestamp is None:
+                timestamp = self._extract_timestamp(line)
 
-            return create_event(
+            return Event(
                 category="system",
                 event_type="unexpected_reboot",
                 severity="warning",
@@ -396,14 +639,24 @@ class LinuxSystemCollector:
             )
 
         except Exception as e:
-            print(f"Error parsing reboot: {e}")
+            self._warn_once(('reboot', type(e).__name__), f"Error parsing reboot: {e}")
             return None
 
+    def _warn_once(self, key: Tuple[str, str], msg: str) -> None:
+        """Log msg as a warning, at most once per key every ERROR_REPEAT_INTERVAL seconds."""
+        now = time.monotonic()
+        last = self._err_cache.get(key)
+        if last is not None and now - last < ERROR_REPEAT_INTERVAL:
+            return
+
+        self._err_cache[key] = now
+        logger.warning(msg)
+
     def _extract_timestamp(self, line: str) -> datetime:
         """Extract timestamp from log line."""
         try:
             # Check if journald format (ISO timestamp at start)
-            if re.match(r'^\d{4}-\d{2}-\d{2}T', line):
+            if _ISO_TS_RE.match(line):
                 timestamp_str = line.split()[0]
                 return datetime.fromisoformat(timestamp_str.replace('+0000', ''))
             else:
@@ -419,7 +672,7 @@ class LinuxSystemCollector:
         return "journald"
 
 
-def collect_system_events(log_file: str = None, max_lines: int = 1000) -> List[Dict[str, Any]]:
+def collect_system_events(log_file: str = None, max_lines: int = 1000) -> List[Event]:
     """
     Convenience function to collect system crash events.
 
@@ -428,7 +681,7 @@ def collect_system_events(log_file: str = None, max_lines: int = 1000) -> List[D
         max_lines: Maximum lines to process
 
     Returns:
-        list: List of event dictionaries
+        list: List of Event objects
 
     Example:
         events = collect_system_events()
@@ -455,7 +708,7 @@ if __name__ == "__main__":
         print("Sample events:")
         for i, event in enumerate(events[:3], 1):
             print(f"\nEvent {i}:")
-            print(json.dumps(event, indent=2))
+            print(json.dumps(event.to_dict(), indent=2))
 
         # Summary
         print("\n" + "=" * 70)
@@ -5,19 +5,56 @@ These helper functions make it easier to create standardized events
 without repeating code in every collector.
 """
 
+import os
 import socket
+import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Optional, Tuple
+
+# Seconds the hostname and IP are cached before being looked up again.
+# The agent runs for a long time, and a DHCP lease or hostname can change
+# under it.
+HOST_INFO_TTL = 300
+
+# Lookup name -> (value, time.monotonic() when it was looked up)
+_host_info_cache: Dict[str, Tuple[str, float]] = {}
+
+# Month abbreviations used in syslog timestamps
+MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+# Journal timestamps (__REALTIME_TIMESTAMP) count microseconds from here
+EPOCH = datetime(1970, 1, 1)
+
+# Log files are read backwards from the end in blocks of this size
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _cached_host_info(name: str, lookup: Callable[[], str]) -> str:
+    """Return a cached host lookup, redoing it once HOST_INFO_TTL has passed."""
+    now = time.monotonic()
+    cached = _host_info_cache.get(name)
+    if cached is not None and now - cached[1] < HOST_INFO_TTL:
+        return cached[0]
+
+    value = lookup()
+    _host_info_cache[name] = (value, now)
+    return value
 
 
 def get_hostname() -> str:
     """
     Get the hostname of this machine.
 
+    The result is cached for HOST_INFO_TTL seconds, so every collector
+    (and create_event) can call this freely.
+
     Returns:
         str: The hostname (e.g., "webserver-01")
     """
-    return socket.gethostname()
+    return _cached_host_info('hostname', socket.gethostname)
 
 
 def get_local_ip() -> str:
@@ -31,7 +68,14 @@ def get_local_ip() -> str:
         This gets the IP by creating a temporary UDP connection.
         It doesn't actually send any data, just figures out which
         network interface would be used to reach the internet.
+        The result is cached for HOST_INFO_TTL seconds, so the socket
+        work only happens once in that time.
     """
+    return _cached_host_info('local_ip', _lookup_local_ip)
+
+
+def _lookup_local_ip() -> str:
+    """Find the primary IPv4 address (uncached, see get_local_ip())."""
     try:
         # Create a socket to figure out which IP we'd use
         # We use Google's DNS (8.8.8.8) as the destination, but don't actually connect
@@ -114,6 +158,94 @@ def create_event(
     }
 
 
+class Event:
+    """
+    A standardized event that is only turned into a dict when serialized.
+
+    Takes the same arguments as create_event(), but keeps the fields in
+    __slots__ instead of building the 11-key schema dict (and the ISO
+    "time" string) for every event up front. Events can be read like the
+    dict (event['event_type'], event.get('severity')), and to_dict() gives
+    the plain Loglumen JSON schema dict for serialization.
+
+    All collectors share this class. A collector that can build some
+    fields lazily subclasses it and replaces those fields with properties.
+    """
+
+    __slots__ = (
+        'category', 'event_type', 'severity', 'message', 'source', 'os',
+        'data', 'host', 'host_ipv4', 'timestamp'
+    )
+
+    # Slots that are also keys of the JSON schema
+    _KEYS = frozenset(__slots__) - {'timestamp'}
+
+    def __init__(
+        self,
+        category: str,
+        event_type: str,
+        severity: str,
+        message: str,
+        source: str,
+        os: str,
+        data: Dict[str, Any],
+        hostname: str = None,
+        host_ip: str = None,
+        timestamp: datetime = None
+    ):
+        self.category = category
+        self.event_type = event_type
+        self.severity = severity
+        self.message = message
+        self.source = source
+        self.os = os
+        self.data = data
+
+        # Auto-detect hostname and IP if not provided
+        self.host = hostname if hostname is not None else get_hostname()
+        self.host_ipv4 = host_ip if host_ip is not None else get_local_ip()
+        self.timestamp = timestamp if timestamp is not None else datetime.utcnow()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._KEYS:
+            return getattr(self, key)
+        if key == 'time':
+            return self.timestamp.isoformat() + "Z"
+        if key == 'schema_version':
+            return 1
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style get() for callers written against event dicts."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a standardized event dictionary.
+
+        Returns:
+            dict: Built by create_event(), ready for JSON
+        """
+        return create_event(
+            category=self.category,
+            event_type=self.event_type,
+            severity=self.severity,
+            message=self.message,
+            source=self.source,
+            os=self.os,
+            hostname=self.host,
+            host_ip=self.host_ipv4,
+            timestamp=self.timestamp,
+            data=self.data
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.category!r}, {self.event_type!r}, {self.message!r})"
+
+
 def parse_syslog_timestamp(log_line: str, year: int = None) -> datetime:
     """
     Parse a syslog-format timestamp from a log line.
@@ -134,6 +266,25 @@ def parse_syslog_timestamp(log_line: str, year: int = None) -> datetime:
     if year is None:
         year = datetime.utcnow().year
 
+    # The layout is fixed ("Nov 16 14:30:25", day padded with a space), so
+    # check it and slice the fields out directly instead of going through
+    # strptime, which is several times slower
+    if (log_line[3:4] == ' ' and log_line[6:7] == ' '
+            and log_line[9:10] == ':' and log_line[12:13] == ':'
+            and log_line[4:6].lstrip(' ').isdigit()
+            and (log_line[7:9] + log_line[10:12] + log_line[13:15]).isdigit()):
+        try:
+            return datetime(
+                year,
+                MONTHS[log_line[0:3]],
+                int(log_line[4:6]),
+                int(log_line[7:9]),
+                int(log_line[10:12]),
+                int(log_line[13:15])
+            )
+        except (KeyError, ValueError):
+            pass  # Not quite the usual layout, let strptime have a go
+
     try:
         # Extract first 15 characters: "Nov 16 14:30:25"
         timestamp_str = log_line[:15]
@@ -143,3 +294,85 @@ def parse_syslog_timestamp(log_line: str, year: int = None) -> datetime:
     except Exception:
         # If parsing fails, return current time
         return datetime.utcnow()
+
+
+def read_tail_lines(
+    path: str,
+    n: int,
+    since: Optional[Tuple[int, int]] = None,
+    include_partial: bool = False
+) -> Tuple[bytes, Tuple[int, int]]:
+    """
+    Read the last n lines of a log file without reading the whole file.
+
+    Logs can be hundreds of MB, so instead of readlines() this reads
+    fixed-size blocks backwards from the end of the file until it has n
+    lines, however long they are. A last line without its newline is
+    still being written, so by default it is left for the next read.
+
+    Args:
+        path: File to read
+        n: Number of lines to return
+        since: Position returned by an earlier call for the same file.
+            Only lines written after it are read, unless the file has been
+            rotated or truncated since; then the new file is read from the
+            top.
+        include_partial: Also return a last line without a newline, as
+            readlines() would (for reads that aren't continued later)
+
+    Returns:
+        tuple: (the last n lines as raw bytes, line endings included;
+            position to pass as since to the next call, just past the last
+            complete line)
+
+    Example:
+        data, position = read_tail_lines("/var/log/auth.log", 1000)
+        # ...later, only what was appended in between:
+        data, position = read_tail_lines("/var/log/auth.log", 1000, position)
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        stat = os.fstat(fd)
+        pos = stat.st_size
+
+        start = 0
+        if since is not None:
+            inode, offset = since
+            # A new inode or a shorter file means the log was rotated or
+            # truncated
+            if inode == stat.st_ino and offset <= pos:
+                start = offset
+
+        blocks = []
+        newlines = 0
+
+        # One newline more than n marks the start of the first line we
+        # want (unless we reach start first). The first read runs back to
+        # a block boundary, so every read after it is a full,
+        # block-aligned TAIL_BLOCK_SIZE read, and each one is a single
+        # positioned read straight into a bytes object.
+        while pos > start and newlines <= n:
+            size = min(pos % TAIL_BLOCK_SIZE or TAIL_BLOCK_SIZE, pos - start)
+            pos -= size
+            block = os.pread(fd, size, pos)
+            blocks.append(block)
+            newlines += block.count(b'\n')
+    finally:
+        os.close(fd)
+
+    blocks.reverse()
+    data = b''.join(blocks)
+
+    # Stop at the last complete line, unless a partial one was asked for
+    complete = data.rfind(b'\n') + 1
+    end = len(data) if include_partial else complete
+
+    # Back up over the newlines ending the last n lines; if there are
+    # fewer, the loop above read back to start, which is a line start
+    first = end - 1 if end == complete else end
+    for _ in range(n):
+        first = data.rfind(b'\n', 0, first)
+        if first < 0:
+            break
+
+    return data[first + 1:end], (stat.st_ino, pos + complete)
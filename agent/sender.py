@@ -25,6 +25,20 @@ except ImportError:
     except ImportError:
         URLLIB_AVAILABLE = False
 
+# Try to import orjson (much faster JSON encoder, optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _event_to_json(obj: Any) -> Dict[str, Any]:
+    """json.dumps() fallback for event objects that aren't plain dicts."""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class SenderError(Exception):
     """Raised when sending events fails."""
@@ -135,7 +149,10 @@ class EventSender:
     def _send_batch(self, batch: List[Dict[str, Any]]) -> bool:
         """Send a single batch to the server."""
         # Prepare JSON payload
-        payload = json.dumps(batch)
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(batch, default=_event_to_json)
+        else:
+            payload = json.dumps(batch, default=_event_to_json).encode('utf-8')
 
         # Prepare headers
         headers = {
@@ -156,7 +173,7 @@ class EventSender:
         else:
             raise SenderError("No HTTP library available")
 
-    def _send_with_requests(self, payload: str, headers: Dict[str, str]) -> bool:
+    def _send_with_requests(self, payload: bytes, headers: Dict[str, str]) -> bool:
         """Send using the requests library."""
         try:
             response = requests.post(
@@ -184,16 +201,13 @@ class EventSender:
             print(f"\n[ERROR] Unexpected error: {e}")
             return False
 
-    def _send_with_urllib(self, payload: str, headers: Dict[str, str]) -> bool:
+    def _send_with_urllib(self, payload: bytes, headers: Dict[str, str]) -> bool:
         """Send using urllib (fallback if requests not available)."""
         try:
-            # Convert payload to bytes
-            payload_bytes = payload.encode('utf-8')
-
             # Create request
             req = urllib.request.Request(
                 self.server_url,
-                data=payload_bytes,
+                data=payload,
                 headers=headers,
                 method='POST'
             )
@@ -267,7 +267,8 @@ def save_events(all_events, filename):
 
     try:
         with open(filename, 'w') as f:
-            json.dump(events, f, indent=2)
+            # Collectors return Event objects; convert them on the way out
+            json.dump(events, f, indent=2, default=lambda event: event.to_dict())
 
         size = os.path.getsize(filename)
         print(f"\n✅ Saved {len(events)} events to: {filename}")
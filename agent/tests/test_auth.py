@@ -0,0 +1,208 @@
+"""
+Tests for the Linux auth log collector in collectors/linux/auth.py
+
+Run with: python -m pytest agent/tests
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors.linux import auth, auth_unified
+
+SSH_ACCEPT = (
+    b'Mar 14 09:21:07 web01 sshd[2211]: Accepted publickey for alice '
+    b'from 203.0.113.7 port 51234 ssh2: ED25519 SHA256:abc\n'
+)
+SSH_FAIL = (
+    b'Mar 14 09:22:41 web01 sshd[2230]: Failed password for invalid user '
+    b'admin from 198.51.100.23 port 40022 ssh2\n'
+)
+NOISE = b'Mar 14 09:23:00 web01 CRON[2240]: pam_unix(cron:session): session closed for user root\n'
+
+
+def _append(path, *lines):
+    with open(path, 'ab') as f:
+        f.write(b''.join(lines))
+
+
+def test_second_call_returns_only_appended_lines(tmp_path):
+    path = str(tmp_path / 'auth.log')
+    _append(path, SSH_ACCEPT, NOISE)
+
+    first = auth.collect_auth_events(log_file=path)
+    assert [e['event_type'] for e in first] == ['ssh_login_success']
+
+    assert auth.collect_auth_events(log_file=path) == []
+
+    _append(path, NOISE, SSH_FAIL)
+    second = auth.collect_auth_events(log_file=path)
+    assert [e['event_type'] for e in second] == ['ssh_login_failed']
+
+
+def test_unified_collector_keeps_its_position(tmp_path):
+    path = str(tmp_path / 'auth.log')
+    _append(path, SSH_ACCEPT)
+
+    assert len(auth_unified.collect_auth_events(log_file=path)) == 1
+    _append(path, SSH_FAIL)
+    second = auth_unified.collect_auth_events(log_file=path)
+    assert [e['event_type'] for e in second] == ['ssh_login_failed']
+
+
+def test_position_not_advanced_when_parsing_fails(tmp_path, monkeypatch):
+    path = str(tmp_path / 'auth.log')
+    _append(path, SSH_ACCEPT)
+    collector = auth.LinuxAuthCollector(path)
+
+    def fail(*args):
+        raise ValueError('parser broke')
+
+    monkeypatch.setattr(collector, '_parse_program_line', fail)
+    assert collector.collect_events() == []
+    assert collector.last_position is None
+
+    monkeypatch.undo()
+    assert len(collector.collect_events()) == 1
+
+
+def test_read_errors_are_logged(tmp_path, monkeypatch, capsys, caplog):
+    path = str(tmp_path / 'auth.log')
+    _append(path, SSH_ACCEPT)
+    collector = auth.LinuxAuthCollector(path)
+
+    def fail(*args):
+        raise ValueError('parser broke')
+
+    monkeypatch.setattr(collector, '_parse_program_line', fail)
+    collector.collect_events()
+
+    assert [r.getMessage() for r in caplog.records] == ['Error reading log file: parser broke']
+    assert capsys.readouterr().out == ''
+
+
+@pytest.mark.parametrize('line, category, event_type, severity, message, data', [
+    (
+        SSH_ACCEPT,
+        'remote_access', 'ssh_login_success', 'info',
+        'User alice logged in via SSH from 203.0.113.7',
+        {'username': 'alice', 'remote_ip': '203.0.113.7', 'auth_method': 'publickey',
+         'port': 51234, 'protocol': 'ssh'},
+    ),
+    (
+        SSH_FAIL,
+        'remote_access', 'ssh_login_failed', 'warning',
+        'Failed SSH login for admin from 198.51.100.23 - Invalid user',
+        {'username': 'admin', 'remote_ip': '198.51.100.23', 'port': 40022,
+         'reason': 'Invalid user', 'invalid_user': True, 'protocol': 'ssh'},
+    ),
+    (
+        b'Mar 14 09:22:50 web01 sshd[2233]: Failed password for bob from 198.51.100.24 port 40030 ssh2\n',
+        'remote_access', 'ssh_login_failed', 'warning',
+        'Failed SSH login for bob from 198.51.100.24 - Bad password',
+        {'username': 'bob', 'remote_ip': '198.51.100.24', 'port': 40030,
+         'reason': 'Bad password', 'invalid_user': False, 'protocol': 'ssh'},
+    ),
+    (
+        b'Mar 14 09:24:02 web01 sudo:    alice : TTY=pts/0 ; PWD=/home/alice ; USER=root ; '
+        b'COMMAND=/usr/bin/systemctl restart nginx\n',
+        'privilege_escalation', 'sudo_used', 'info',
+        'User alice used sudo to run: /usr/bin/systemctl restart nginx',
+        {'username': 'alice', 'command': '/usr/bin/systemctl restart nginx', 'target_user': 'root',
+         'tty': 'pts/0', 'pwd': '/home/alice', 'success': True},
+    ),
+    (
+        b'Mar 14 09:25:13 web01 su[2301]: (to root) alice on pts/1\n',
+        'privilege_escalation', 'su_success', 'info',
+        'User alice switched to root',
+        {'username': 'alice', 'target_user': 'root', 'tty': 'pts/1', 'success': True},
+    ),
+    (
+        b'Mar 14 09:25:13 web01 su[2305]: FAILED SU (to root) bob on pts/2\n',
+        'privilege_escalation', 'su_failed', 'warning',
+        'User bob failed to switch to root',
+        {'username': 'bob', 'target_user': 'root', 'tty': 'pts/2', 'success': False},
+    ),
+    (
+        b'Mar 14 09:26:55 web01 login[2310]: pam_unix(login:session): session opened '
+        b'for user carol by LOGIN(uid=0)\n',
+        'authentication', 'local_login_success', 'info',
+        'Local login for user carol',
+        {'username': 'carol', 'login_type': 'local', 'success': True},
+    ),
+    (
+        b'Mar 14 09:28:00 web01 login[2314]: pam_unix(login:auth): authentication failure; '
+        b'logname=LOGIN uid=0 euid=0 tty=/dev/tty2 ruser= rhost=  user=dave\n',
+        'authentication', 'local_login_failed', 'warning',
+        'Local login failed for user dave',
+        {'username': 'dave', 'login_type': 'local', 'success': False},
+    ),
+])
+def test_parsers(tmp_path, line, category, event_type, severity, message, data):
+    path = str(tmp_path / 'auth.log')
+    _append(path, NOISE, line)
+
+    events = auth.LinuxAuthCollector(path).collect_events()
+
+    assert len(events) == 1
+    event = events[0]
+    assert event['category'] == category
+    assert event['event_type'] == event_type
+    assert event['severity'] == severity
+    assert event['message'] == message
+    assert event['data'] == data
+    assert event['source'] == 'auth.log'
+    assert event['os'] == 'linux'
+
+    # Syslog timestamps carry no year; the current one is assumed
+    stamp = datetime.strptime(line[:15].decode(), '%b %d %H:%M:%S')
+    assert event.timestamp == stamp.replace(year=datetime.utcnow().year)
+
+
+MIXED_LOG = [
+    NOISE,
+    SSH_ACCEPT,
+    b'Mar 14 09:21:30 web01 systemd-logind[611]: New session 12 of user alice.\n',
+    b'Mar 14 09:21:31 web01 sshd[2211]: pam_unix(sshd:session): session opened for user alice(uid=1000)\n',
+    b'Mar 14 09:22:00 web01 CRON[2240]: (root) CMD (cd / && run-parts --report /etc/cron.hourly)\n',
+    SSH_FAIL,
+    b'Mar 14 09:24:02 web01 sudo:    alice : TTY=pts/0 ; PWD=/home/alice ; USER=root ; COMMAND=/usr/bin/id\n',
+    b'Mar 14 09:24:02 web01 sudo: pam_unix(sudo:session): session opened for user root(uid=0) by alice(uid=1000)\n',
+    b'Mar 14 09:25:13 web01 su: (to root) alice on pts/1\n',
+    b'Mar 14 09:26:55 web01 login[2310]: pam_unix(login:session): session opened for user carol by LOGIN(uid=0)\n',
+    b'Mar 14 09:27:00 web01 kernel: [ 1234.5678] audit: type=1400 audit(1710408420.123:55): apparmor="DENIED"\n',
+]
+
+
+def test_prefilter_and_dispatch(tmp_path):
+    # Lines from other programs never become events, and each tagged line
+    # ("sshd[", "sudo:", " su:", "login[") goes to its parser
+    path = str(tmp_path / 'auth.log')
+    _append(path, *MIXED_LOG)
+
+    events = auth.LinuxAuthCollector(path).collect_events()
+
+    assert [e['event_type'] for e in events] == [
+        'ssh_login_success', 'ssh_login_failed', 'sudo_used', 'su_success',
+        'local_login_success',
+    ]
+
+
+def test_block_and_single_line_paths_agree(tmp_path):
+    # collect_events() dispatches on the tag the prefilter captured;
+    # _parse_log_line() finds the tag itself. Both give the same events.
+    path = str(tmp_path / 'auth.log')
+    _append(path, *MIXED_LOG)
+    collector = auth.LinuxAuthCollector(path)
+
+    from_block = collector.collect_events()
+    from_lines = [
+        event for event in map(collector._parse_log_line, (l.decode() for l in MIXED_LOG))
+        if event
+    ]
+
+    assert [e.to_dict() for e in from_block] == [e.to_dict() for e in from_lines]
@@ -0,0 +1,274 @@
+"""
+Tests for the journald auth collector in collectors/linux/auth_journald.py
+
+Run with: python -m pytest agent/tests
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors.linux import auth_journald
+from collectors.linux.auth_journald import JournaldAuthCollector
+
+# 2025-11-16 14:30:25.123456 UTC
+REALTIME = '1763303425123456'
+
+
+def test_local_login_success():
+    event = JournaldAuthCollector()._parse_journal_entry(
+        'login',
+        'pam_unix(login:session): session opened for user bob by LOGIN(uid=0)',
+        REALTIME
+    )
+
+    assert event['category'] == 'authentication'
+    assert event['event_type'] == 'local_login_success'
+    assert event['severity'] == 'info'
+    assert event['message'] == 'Local login for user bob'
+    assert event['source'] == 'journald'
+    assert event.timestamp == datetime(2025, 11, 16, 14, 30, 25, 123456)
+    assert event['data'] == {'username': 'bob', 'login_type': 'local', 'success': True}
+
+
+def test_local_login_failure():
+    event = JournaldAuthCollector()._parse_journal_entry(
+        'login',
+        'pam_unix(login:auth): authentication failure; logname=LOGIN uid=0 '
+        'euid=0 tty=/dev/tty1 ruser= rhost=  user=bob',
+        REALTIME
+    )
+
+    assert event['event_type'] == 'local_login_failed'
+    assert event['severity'] == 'warning'
+    assert event['data'] == {'username': 'bob', 'login_type': 'local', 'success': False}
+
+
+def _entry(comm, message):
+    return JournaldAuthCollector()._parse_journal_entry(comm, message, REALTIME)
+
+
+def test_ssh_accepted():
+    event = _entry('sshd', 'Accepted publickey for alice from 192.168.1.50 port 54321 ssh2')
+
+    assert event['category'] == 'remote_access'
+    assert event['event_type'] == 'ssh_login_success'
+    assert event['severity'] == 'info'
+    assert event['message'] == 'User alice logged in via SSH from 192.168.1.50'
+    assert event['source'] == 'journald'
+    assert event.timestamp == datetime(2025, 11, 16, 14, 30, 25, 123456)
+    assert event['data'] == {
+        'username': 'alice', 'remote_ip': '192.168.1.50',
+        'auth_method': 'publickey', 'port': 54321, 'protocol': 'ssh'
+    }
+
+
+def test_ssh_failed_password():
+    event = _entry('sshd', 'Failed password for bob from 10.0.0.5 port 22 ssh2')
+
+    assert event['event_type'] == 'ssh_login_failed'
+    assert event['severity'] == 'warning'
+    assert event['message'] == 'Failed SSH login for bob from 10.0.0.5 - Bad password'
+    assert event['data'] == {
+        'username': 'bob', 'remote_ip': '10.0.0.5', 'port': 22,
+        'reason': 'Bad password', 'invalid_user': False, 'protocol': 'ssh'
+    }
+
+
+def test_ssh_failed_invalid_user():
+    event = _entry('sshd', 'Failed password for invalid user admin from 203.0.113.9 port 41000 ssh2')
+
+    assert event['message'] == 'Failed SSH login for admin from 203.0.113.9 - Invalid user'
+    assert event['data']['username'] == 'admin'
+    assert event['data']['reason'] == 'Invalid user'
+    assert event['data']['invalid_user'] is True
+
+
+def test_sudo_command():
+    event = _entry(
+        'sudo',
+        '   alice : TTY=pts/0 ; PWD=/home/alice ; USER=root ; COMMAND=/usr/bin/apt update'
+    )
+
+    assert event['category'] == 'privilege_escalation'
+    assert event['event_type'] == 'sudo_used'
+    assert event['severity'] == 'info'
+    assert event['message'] == 'User alice used sudo to run: /usr/bin/apt update'
+    assert event.timestamp == datetime(2025, 11, 16, 14, 30, 25, 123456)
+    assert event['data'] == {
+        'username': 'alice', 'command': '/usr/bin/apt update',
+        'target_user': 'root', 'tty': 'pts/0', 'pwd': '/home/alice',
+        'success': True
+    }
+
+
+def test_su_success():
+    event = _entry('su', '(to root) alice on pts/0')
+
+    assert event['category'] == 'privilege_escalation'
+    assert event['event_type'] == 'su_success'
+    assert event['severity'] == 'info'
+    assert event['message'] == 'User alice switched to root'
+    assert event['data'] == {
+        'username': 'alice', 'target_user': 'root', 'tty': 'pts/0', 'success': True
+    }
+
+
+def test_su_failure():
+    event = _entry('su', 'FAILED SU (to root) alice on pts/0')
+
+    assert event['event_type'] == 'su_failed'
+    assert event['severity'] == 'warning'
+    assert event['message'] == 'User alice failed to switch to root'
+    assert event['data']['success'] is False
+
+
+def test_dispatch_by_program():
+    accepted = 'Accepted publickey for alice from 192.168.1.50 port 54321 ssh2'
+
+    # OpenSSH 9.8+ logs logins from sshd-session
+    assert _entry('sshd-session', accepted)['data'] == _entry('sshd', accepted)['data']
+
+    # The parser is picked by _COMM alone, not by what the message looks like
+    assert _entry('cron', accepted) is None
+    assert _entry('sudo', accepted) is None
+
+    # sudo's PAM session lines are not commands
+    assert _entry('sudo', 'pam_unix(sudo:session): session opened for user root(uid=0) by alice(uid=1000)') is None
+    assert _entry('sshd', 'Connection closed by 10.0.0.5 port 22 [preauth]') is None
+
+
+def test_every_matched_program_has_a_parser():
+    programs = {match.split('=', 1)[1] for match in auth_journald.JOURNAL_MATCHES}
+    assert programs <= set(auth_journald._PARSERS)
+
+
+def _event(message, timestamp):
+    return auth_journald.Event(
+        'authentication', 'ssh_login_failed', 'warning', message,
+        'journald', 'linux', {}, 'host', '127.0.0.1', timestamp
+    )
+
+
+class _FakeCollector:
+    """Stands in for JournaldAuthCollector, returning one batch per call."""
+
+    batches = []
+    calls = 0
+
+    def collect_events(self, hours, max_lines, workers):
+        type(self).calls += 1
+        return self.batches.pop(0)
+
+
+def _use_fake_collector(monkeypatch, batches):
+    monkeypatch.setattr(auth_journald, '_CACHE', {})
+    monkeypatch.setattr(auth_journald, 'JournaldAuthCollector', _FakeCollector)
+    monkeypatch.setattr(_FakeCollector, 'batches', batches)
+    monkeypatch.setattr(_FakeCollector, 'calls', 0)
+    clock = [1000.0]
+    monkeypatch.setattr(auth_journald.time, 'monotonic', lambda: clock[0])
+    return clock
+
+
+def test_cache_hit_within_ttl(monkeypatch):
+    now = datetime.utcnow()
+    _use_fake_collector(monkeypatch, [[_event('a', now)]])
+
+    first = auth_journald.collect_auth_events(hours=1, max_lines=10)
+    second = auth_journald.collect_auth_events(hours=1, max_lines=10)
+
+    assert [e['message'] for e in second] == ['a']
+    assert second == first and second is not first
+    assert _FakeCollector.calls == 1
+
+
+def test_refresh_merges_and_caps(monkeypatch):
+    now = datetime.utcnow()
+    clock = _use_fake_collector(monkeypatch, [
+        [_event('a', now), _event('b', now)],
+        [_event('c', now), _event('d', now)],
+    ])
+
+    auth_journald.collect_auth_events(hours=1, max_lines=3)
+    clock[0] += auth_journald.CACHE_TTL
+    events = auth_journald.collect_auth_events(hours=1, max_lines=3)
+
+    # Old and new events together, only the most recent max_lines kept
+    assert [e['message'] for e in events] == ['b', 'c', 'd']
+    assert _FakeCollector.calls == 2
+
+
+def test_refresh_drops_events_outside_the_window(monkeypatch):
+    now = datetime.utcnow()
+    clock = _use_fake_collector(monkeypatch, [
+        [_event('old', now - timedelta(hours=2)), _event('recent', now)],
+        [_event('new', now)],
+    ])
+
+    auth_journald.collect_auth_events(hours=1, max_lines=10)
+    clock[0] += auth_journald.CACHE_TTL
+    events = auth_journald.collect_auth_events(hours=1, max_lines=10)
+
+    assert [e['message'] for e in events] == ['recent', 'new']
+
+
+def test_seen_pruned_to_the_window():
+    collector = JournaldAuthCollector()
+    now = int(time.time())
+    old = auth_journald._repeat_key('sshd', 'm', '%d000000' % (now - 7200))
+    recent = auth_journald._repeat_key('sshd', 'm', '%d000000' % now)
+    no_time = auth_journald._repeat_key('sshd', 'm', None)
+    collector._seen = {old, recent, no_time}
+
+    collector._prune_seen(1)
+
+    assert collector._seen == {recent}
+
+
+def _sshd_record(i):
+    message = 'Failed password for bob from 10.0.0.%d port 22 ssh2' % (i % 4)
+    return json.dumps({
+        '_COMM': 'sshd',
+        'MESSAGE': message,
+        '__REALTIME_TIMESTAMP': '%d000000' % (1763303425 + i // 8),
+    }).encode()
+
+
+def test_parallel_parse_matches_single_process(monkeypatch):
+    monkeypatch.setattr(auth_journald, 'PARALLEL_CHUNK_SIZE', 10)
+    records = [_sshd_record(i) for i in range(200)]
+
+    single = JournaldAuthCollector()
+    expected = [single._parse_journal_record(r) for r in records]
+    expected = [e['data'] for e in expected if e]
+
+    consumed = []
+
+    def feed():
+        for record in records:
+            consumed.append(record)
+            yield record
+
+    parallel = JournaldAuthCollector()
+    events = parallel._parse_records_parallel(feed(), workers=2)
+    first = next(events)
+
+    # The first events come out before journalctl's output is used up,
+    # with no more than the in-flight window of chunks read ahead
+    assert len(consumed) <= (2 * 2 + 1) * 10
+
+    assert [first['data']] + [e['data'] for e in events] == expected
+
+
+def test_missing_timestamp_falls_back_to_now():
+    before = datetime.utcnow()
+    event = JournaldAuthCollector()._parse_journal_entry(
+        'sshd', 'Accepted password for alice from 192.0.2.4 port 50022 ssh2', None
+    )
+
+    assert before <= event.timestamp <= datetime.utcnow()
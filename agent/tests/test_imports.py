@@ -0,0 +1,77 @@
+"""
+Import tests for the Linux collectors
+
+The collectors are imported two ways: as linux.<module> with
+agent/collectors on sys.path (what main.py does), and as
+collectors.linux.<module> from the agent directory (what the docs
+show). Each import runs in a fresh interpreter so modules cached by one
+style can't hide a failure in the other.
+
+Run with: python -m pytest agent/tests
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+AGENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COLLECTORS_DIR = os.path.join(AGENT_DIR, 'collectors')
+
+LINUX_MODULES = [
+    'auth',
+    'auth_journald',
+    'auth_unified',
+    'journal_native',
+    'service',
+    'software',
+    'system',
+]
+
+
+def _import_ok(module: str, path: str) -> subprocess.CompletedProcess:
+    """Import module in a new interpreter with path first on sys.path."""
+    code = f"import sys; sys.path.insert(0, {path!r}); import {module}"
+    return subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=path,
+        capture_output=True,
+        text=True
+    )
+
+
+@pytest.mark.parametrize('name', LINUX_MODULES)
+def test_import_as_linux_package(name):
+    """main.py style: agent/collectors on sys.path, import linux.<name>."""
+    result = _import_ok(f'linux.{name}', COLLECTORS_DIR)
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize('name', LINUX_MODULES)
+def test_import_as_collectors_package(name):
+    """Package style: agent on sys.path, import collectors.linux.<name>."""
+    result = _import_ok(f'collectors.linux.{name}', AGENT_DIR)
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize('package, path', [
+    ('linux', COLLECTORS_DIR),
+    ('collectors.linux', AGENT_DIR),
+])
+def test_single_utils_module(package, path):
+    """All collectors share one utils module, whichever way they are imported."""
+    modules = ', '.join(f'{package}.{name}' for name in LINUX_MODULES)
+    code = (
+        f"import json, sys; sys.path.insert(0, {path!r}); import {modules}; "
+        "print(json.dumps(sorted(m for m in sys.modules if m.split('.')[-1] == 'utils')))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=path,
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert len(json.loads(result.stdout)) == 1, result.stdout
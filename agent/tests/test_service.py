@@ -0,0 +1,138 @@
+"""
+Tests for the Linux service failure collector in collectors/linux/service.py
+
+Run with: python -m pytest agent/tests
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors.linux import service
+from collectors.linux.service import LinuxServiceCollector
+
+FAILURE_ENTRY = {
+    'MESSAGE': "nginx.service: Failed with result 'exit-code'.",
+    'SYSLOG_IDENTIFIER': 'systemd',
+    'UNIT': 'nginx.service',
+    '__REALTIME_TIMESTAMP': '1763303425000000',
+}
+
+
+def _journal_event(message):
+    return LinuxServiceCollector()._parse_journal_entry(dict(FAILURE_ENTRY, MESSAGE=message))
+
+
+def test_service_failure_details():
+    event = _journal_event("nginx.service: Failed with result 'exit-code'.")
+
+    assert event['category'] == 'service'
+    assert event['event_type'] == 'service_failed'
+    assert event['severity'] == 'error'
+    assert event['source'] == 'journald'
+    assert event['message'] == 'Service nginx failed: exit-code'
+    assert event.timestamp == datetime(2025, 11, 16, 14, 30, 25)
+    assert event['data'] == {
+        'service_name': 'nginx', 'failure_reason': 'exit-code',
+        'exit_code': None, 'unit_type': 'systemd'
+    }
+
+
+def test_service_failure_with_exit_code():
+    event = _journal_event(
+        "nginx.service: Main process exited, code=exited, status=1/FAILURE; "
+        "Failed with result 'exit-code'."
+    )
+
+    assert event['message'] == 'Service nginx failed: exit-code'
+    assert event['data']['failure_reason'] == 'exit-code'
+    assert event['data']['exit_code'] == 'exited'
+
+
+def test_service_failure_without_reason():
+    event = _journal_event('Failed to start nginx.service - A high performance web server.')
+
+    assert event['message'] == 'Service nginx failed: unknown'
+    assert event['data']['service_name'] == 'nginx'
+    assert event['data']['failure_reason'] == 'unknown'
+
+
+# Stands in for journalctl: logs its arguments, fails like a journalctl
+# without PCRE2 when given --grep, and prints one service failure
+FAKE_JOURNALCTL = '''#!{python}
+import sys
+args = sys.argv[1:]
+with open({log!r}, 'a') as f:
+    f.write(' '.join(args) + '\\n')
+if '--grep' in args:
+    sys.exit(1)
+if '--version' not in args:
+    print({entry!r})
+'''
+
+
+def _fake_journalctl(tmp_path, monkeypatch):
+    log = tmp_path / 'args.log'
+    script = tmp_path / 'journalctl'
+    script.write_text(FAKE_JOURNALCTL.format(
+        python=sys.executable, log=str(log), entry=json.dumps(FAILURE_ENTRY)
+    ))
+    script.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(service, 'LIBSYSTEMD_AVAILABLE', False)
+    monkeypatch.setattr(LinuxServiceCollector, '_HAS_GREP', None)
+    return log
+
+
+def test_query_without_grep_when_unsupported(tmp_path, monkeypatch):
+    log = _fake_journalctl(tmp_path, monkeypatch)
+
+    events = LinuxServiceCollector()._collect_from_journald(hours=1, max_lines=10)
+
+    assert LinuxServiceCollector._HAS_GREP is False
+    assert [e['data']['service_name'] for e in events] == ['nginx']
+
+    # --grep was probed for once, and the query itself ran without it
+    calls = log.read_text().splitlines()
+    assert len([call for call in calls if call.startswith('--grep')]) == 1
+    queries = [call for call in calls if call.startswith('--since')]
+    assert len(queries) == 1
+    assert '--grep' not in queries[0] and '-p warning' in queries[0]
+
+
+SYSLOG = (
+    b'Nov 16 10:30:00 web01 nginx[812]: [emerg] bind() to 0.0.0.0:80 failed '
+    b'(98: Address already in use)\n'
+)
+
+
+def _collector_with_sources(monkeypatch, journald_events):
+    collector = LinuxServiceCollector()
+    parsed = []
+    monkeypatch.setattr(collector, '_collect_from_journald', lambda hours, max_lines: journald_events)
+    monkeypatch.setattr(collector, '_read_syslog', lambda max_lines: SYSLOG)
+    parse = collector._parse_syslog
+    monkeypatch.setattr(collector, '_parse_syslog', lambda data: parsed.append(data) or parse(data))
+    return collector, parsed
+
+
+def test_syslog_used_when_journald_comes_up_short(monkeypatch):
+    collector, parsed = _collector_with_sources(monkeypatch, [])
+
+    events = collector.collect_events()
+
+    assert parsed == [SYSLOG]
+    assert [(e['event_type'], e['data']['service_name']) for e in events] == [
+        ('service_error', 'nginx')
+    ]
+
+
+def test_syslog_not_parsed_when_journald_has_enough(monkeypatch):
+    journald_events = [object()] * 5
+    collector, parsed = _collector_with_sources(monkeypatch, journald_events)
+
+    assert collector.collect_events() == journald_events
+    assert parsed == []
@@ -0,0 +1,41 @@
+"""
+Tests for the Linux software change collector in collectors/linux/software.py
+
+Run with: python -m pytest agent/tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors.linux import software
+
+INSTALL = b'2025-11-16 10:30:00 install nginx:amd64 <none> 1.18.0-1ubuntu1\n'
+CONFIGURE = b'2025-11-16 10:30:02 configure nginx:amd64 1.18.0-1ubuntu1 <none>\n'
+REMOVE = b'2025-11-16 11:02:41 remove curl:amd64 7.81.0-1 <none>\n'
+
+
+def _append(path, *lines):
+    with open(path, 'ab') as f:
+        f.write(b''.join(lines))
+
+
+def test_two_calls_in_a_row(tmp_path, monkeypatch):
+    path = str(tmp_path / 'dpkg.log')
+    _append(path, INSTALL, CONFIGURE)
+    monkeypatch.setattr(software._get_collector(), 'log_files', [path])
+
+    first = software.collect_software_events()
+    assert [(e.event_type, e.package_name) for e in first] == [
+        ('software_installed', 'nginx')
+    ]
+
+    # Nothing appended: nothing returned
+    assert software.collect_software_events() == []
+
+    _append(path, REMOVE)
+    second = software.collect_software_events()
+    assert [(e.event_type, e.package_name) for e in second] == [
+        ('software_removed', 'curl')
+    ]
@@ -0,0 +1,123 @@
+"""
+Tests for the Linux system crash collector in collectors/linux/system.py
+
+Run with: python -m pytest agent/tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors.linux.system import LinuxSystemCollector
+
+# The kernel's own reports, with every field the fused patterns look for
+OOM_KILL = (
+    'Nov 16 10:00:00 web01 kernel: Out of memory: Killed process 1234 (nginx) '
+    'total-vm:123456kB, anon-rss:4567kB, file-rss:0kB, shmem-rss:0kB, UID:33 '
+    'pgtables:300kB oom_score_adj:0'
+)
+SEGFAULT = (
+    'Nov 16 12:00:00 web01 kernel: nginx[1234]: segfault at 7f1234567890 '
+    'ip 00007f9876543210 sp 00007ffd12345678 error 4 in libc.so.6[7f98765000+195000]'
+)
+
+# Reports missing some of the fields, parsed field by field
+OOM_KILL_NO_NAME = (
+    'Nov 16 10:00:00 web01 kernel: Out of memory: Killed process 1234 '
+    'total-vm:123456kB, anon-rss:4567kB, UID:33 oom_score_adj:0'
+)
+OOM_KILL_SUMMARY = (
+    'Nov 16 10:00:00 web01 kernel: oom-kill:constraint=CONSTRAINT_NONE,'
+    'nodemask=(null),cpuset=/,mems_allowed=0,global_oom,task=nginx,pid=1234,uid=33'
+)
+SHELL_SEGFAULT = 'Nov 16 12:00:00 web01 bash[4321]: Segmentation fault (core dumped) ./worker'
+
+
+def _parse(line):
+    return LinuxSystemCollector('/var/log/kern.log')._parse_log_line(line)
+
+
+def test_oom_kill():
+    event = _parse(OOM_KILL)
+
+    assert event['category'] == 'system'
+    assert event['event_type'] == 'oom_kill'
+    assert event['severity'] == 'error'
+    assert event['message'] == 'Out of memory: Killed process nginx (PID 1234)'
+    assert event['source'] == 'kern.log'
+    assert event.timestamp.timetuple()[1:5] == (11, 16, 10, 0)
+    assert event['data'] == {
+        'process_name': 'nginx', 'pid': 1234,
+        'memory_kb': '123456', 'reason': 'out_of_memory'
+    }
+
+
+def test_oom_kill_without_process_name():
+    event = _parse(OOM_KILL_NO_NAME)
+
+    assert event['message'] == 'Out of memory: Killed process unknown (PID 1234)'
+    assert event['data'] == {
+        'process_name': 'unknown', 'pid': 1234,
+        'memory_kb': '123456', 'reason': 'out_of_memory'
+    }
+
+
+def test_oom_kill_summary_line():
+    event = _parse(OOM_KILL_SUMMARY)
+
+    assert event['event_type'] == 'oom_kill'
+    assert event['data'] == {
+        'process_name': 'unknown', 'pid': None,
+        'memory_kb': 'unknown', 'reason': 'out_of_memory'
+    }
+
+
+def test_segfault():
+    event = _parse(SEGFAULT)
+
+    assert event['category'] == 'system'
+    assert event['event_type'] == 'segmentation_fault'
+    assert event['severity'] == 'warning'
+    assert event['message'] == 'Segmentation fault in nginx (PID 1234)'
+    assert event.timestamp.timetuple()[1:5] == (11, 16, 12, 0)
+    assert event['data'] == {
+        'program': 'nginx', 'pid': 1234,
+        'fault_address': '7f1234567890', 'fault_type': 'segfault'
+    }
+
+
+def test_shell_segfault():
+    event = _parse(SHELL_SEGFAULT)
+
+    assert event['message'] == 'Segmentation fault in unknown (PID 4321)'
+    assert event['data'] == {
+        'program': 'unknown', 'pid': 4321,
+        'fault_address': 'unknown', 'fault_type': 'segfault'
+    }
+
+
+def test_log_file_matches_single_lines(tmp_path):
+    lines = [OOM_KILL, 'Nov 16 10:00:01 web01 kernel: eth0: link up', SEGFAULT,
+             OOM_KILL_NO_NAME, OOM_KILL_SUMMARY, SHELL_SEGFAULT]
+    path = tmp_path / 'kern.log'
+    path.write_text('\n'.join(lines) + '\n')
+
+    events = LinuxSystemCollector(str(path)).collect_events(use_journald=False)
+
+    expected = [_parse(line) for line in lines]
+    assert [e.to_dict() for e in events] == [e.to_dict() for e in expected if e]
+
+
+def test_repeated_parse_errors_logged_once(monkeypatch, capsys, caplog):
+    collector = LinuxSystemCollector('/var/log/kern.log')
+
+    def fail(line):
+        raise ValueError('bad timestamp')
+
+    monkeypatch.setattr(collector, '_extract_timestamp', fail)
+    for _ in range(3):
+        assert collector._parse_log_line(SEGFAULT) is None
+
+    assert [r.getMessage() for r in caplog.records] == ['Error parsing segfault: bad timestamp']
+    assert capsys.readouterr().out == ''
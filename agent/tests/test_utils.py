@@ -0,0 +1,146 @@
+"""
+Tests for the shared collector helpers in collectors/utils.py
+
+Run with: python -m pytest agent/tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors import utils
+from collectors.utils import read_tail_lines
+
+
+def _write(path, lines, tail=b''):
+    """Write numbered log lines (plus an optional unterminated tail)."""
+    with open(path, 'wb') as f:
+        f.write(b''.join(lines) + tail)
+
+
+def _lines(count, length=20, first=0):
+    """count newline-terminated lines of the given length, numbered from first."""
+    return [
+        (b'%06d ' % i).ljust(length - 1, b'x') + b'\n'
+        for i in range(first, first + count)
+    ]
+
+
+def test_last_n_lines(tmp_path):
+    path = tmp_path / 'log'
+    lines = _lines(100)
+    _write(path, lines)
+
+    data, position = read_tail_lines(str(path), 10)
+
+    assert data == b''.join(lines[-10:])
+    assert position == (os.stat(path).st_ino, os.path.getsize(path))
+
+
+def test_fewer_lines_than_requested(tmp_path):
+    path = tmp_path / 'log'
+    lines = _lines(5)
+    _write(path, lines)
+
+    data, _ = read_tail_lines(str(path), 10)
+
+    assert data == b''.join(lines)
+
+
+def test_long_lines_across_blocks(tmp_path, monkeypatch):
+    # Lines longer than a block: the reader must keep going back until
+    # it has all n lines, not stop at a fixed bytes-per-line estimate
+    monkeypatch.setattr(utils, 'TAIL_BLOCK_SIZE', 64)
+    path = tmp_path / 'log'
+    lines = _lines(50, length=1000)
+    _write(path, lines)
+
+    for n in (1, 7, 49, 50, 51):
+        data, _ = read_tail_lines(str(path), n)
+        assert data == b''.join(lines[-n:])
+
+
+def test_partial_last_line(tmp_path):
+    path = tmp_path / 'log'
+    lines = _lines(10)
+    _write(path, lines, tail=b'still being written')
+    complete = len(b''.join(lines))
+
+    data, position = read_tail_lines(str(path), 3)
+    assert data == b''.join(lines[-3:])
+    assert position[1] == complete
+
+    data, position = read_tail_lines(str(path), 3, include_partial=True)
+    assert data == b''.join(lines[-2:]) + b'still being written'
+    assert position[1] == complete
+
+
+def test_no_newline_at_all(tmp_path):
+    path = tmp_path / 'log'
+    _write(path, [], tail=b'no newline')
+
+    assert read_tail_lines(str(path), 5)[0] == b''
+    assert read_tail_lines(str(path), 5, include_partial=True)[0] == b'no newline'
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / 'log'
+    _write(path, [])
+
+    assert read_tail_lines(str(path), 5) == (b'', (os.stat(path).st_ino, 0))
+
+
+def test_since_reads_only_appended_lines(tmp_path):
+    path = tmp_path / 'log'
+    _write(path, _lines(20))
+    _, position = read_tail_lines(str(path), 5)
+
+    # Nothing new yet
+    data, position = read_tail_lines(str(path), 5, position)
+    assert data == b''
+
+    # A line still being written is picked up once it is complete
+    new = _lines(3, first=20)
+    with open(path, 'ab') as f:
+        f.write(b''.join(new) + b'half')
+    data, position = read_tail_lines(str(path), 5, position)
+    assert data == b''.join(new)
+
+    with open(path, 'ab') as f:
+        f.write(b' done\n')
+    data, position = read_tail_lines(str(path), 5, position)
+    assert data == b'half done\n'
+
+
+def test_since_keeps_only_last_n_appended(tmp_path):
+    path = tmp_path / 'log'
+    _write(path, _lines(20))
+    _, position = read_tail_lines(str(path), 5)
+
+    new = _lines(30, first=20)
+    with open(path, 'ab') as f:
+        f.write(b''.join(new))
+
+    data, _ = read_tail_lines(str(path), 5, position)
+    assert data == b''.join(new[-5:])
+
+
+def test_since_after_rotation_and_truncation(tmp_path):
+    path = tmp_path / 'log'
+    _write(path, _lines(20))
+    _, position = read_tail_lines(str(path), 5)
+
+    # Rotated: a new file (new inode) is read from the top
+    os.rename(path, tmp_path / 'log.1')
+    rotated = _lines(2, first=100)
+    _write(path, rotated)
+    data, position = read_tail_lines(str(path), 5, position)
+    assert data == b''.join(rotated)
+
+    # Truncated in place: shorter than the saved offset
+    truncated = _lines(1, first=200)
+    with open(path, 'wb') as f:
+        f.write(truncated[0])
+    data, _ = read_tail_lines(str(path), 5, position)
+    assert data == truncated[0]